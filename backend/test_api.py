@@ -4,51 +4,94 @@ Demonstrates the complete interview flow
 """
 
 import requests
-import json
-import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+import io
+import sys
+import threading
+import orjson
 from pathlib import Path
 
 # API Base URL
 BASE_URL = "http://localhost:8000"
 
+# Shared session so every test reuses the same keep-alive connection pool
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+))
+SESSION.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip"})
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Sample conversation history reused by the follow-up question tests
+SAMPLE_CONVERSATION_HISTORY = [
+    {
+        "role": "assistant",
+        "content": "Hello John Smith! Thank you for taking the time to speak with us today. To start, could you tell me a bit about your background and what drew you to dentistry?"
+    },
+    {
+        "role": "user",
+        "content": "I graduated from dental school at UCLA in 2020. I was drawn to dentistry because I've always been passionate about combining artistic skills with healthcare. During my undergraduate years, I volunteered at a community health clinic where I saw firsthand the impact of oral health on overall wellbeing."
+    }
+]
+
+def post_json(path, payload):
+    """POST a payload serialized with orjson instead of requests' stdlib json"""
+    return SESSION.post(f"{BASE_URL}{path}", data=orjson.dumps(payload), headers=JSON_HEADERS)
+
+def pretty_json(data):
+    """Indented JSON for display"""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
+# Per-thread output buffer for the test currently running
+_output = threading.local()
+
+def out(*args, **kwargs):
+    """print() into the running test's buffer so its output is written in one go"""
+    print(*args, file=getattr(_output, "buffer", None) or sys.stdout, **kwargs)
+
 def print_separator(title=""):
     """Print a visual separator"""
-    print("\n" + "="*60)
+    out("\n" + "="*60)
     if title:
-        print(f"  {title}")
-        print("="*60)
-    print()
+        out(f"  {title}")
+        out("="*60)
+    out()
 
 def test_health_check():
     """Test the root endpoint"""
     print_separator("Testing Health Check")
-    response = requests.get(f"{BASE_URL}/")
-    print(f"Status Code: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
+    response = SESSION.get(f"{BASE_URL}/")
+    out(f"Status Code: {response.status_code}")
+    out(f"Response: {pretty_json(response.json())}")
     return response.status_code == 200
 
 def test_get_categories():
     """Test getting interview categories"""
     print_separator("Testing Get Categories")
-    response = requests.get(f"{BASE_URL}/api/categories")
-    print(f"Status Code: {response.status_code}")
+    response = SESSION.get(f"{BASE_URL}/api/categories")
+    out(f"Status Code: {response.status_code}")
     data = response.json()
-    print(f"Total Categories: {data['total']}")
-    print("Categories:")
+    out(f"Total Categories: {data['total']}")
+    out("Categories:")
     for i, category in enumerate(data['categories'], 1):
-        print(f"  {i}. {category}")
+        out(f"  {i}. {category}")
     return response.status_code == 200
 
 def test_get_interview_types():
     """Test getting interview types"""
     print_separator("Testing Get Interview Types")
-    response = requests.get(f"{BASE_URL}/api/interview-types")
-    print(f"Status Code: {response.status_code}")
+    response = SESSION.get(f"{BASE_URL}/api/interview-types")
+    out(f"Status Code: {response.status_code}")
     data = response.json()
-    print("Available Interview Types:")
+    out("Available Interview Types:")
     for interview_type in data['types']:
-        print(f"\n  Type: {interview_type}")
-        print(f"  Description: {data['descriptions'][interview_type]}")
+        out(f"\n  Type: {interview_type}")
+        out(f"  Description: {data['descriptions'][interview_type]}")
     return response.status_code == 200
 
 def test_start_interview(interview_type="dentist"):
@@ -61,99 +104,80 @@ def test_start_interview(interview_type="dentist"):
         "user_email": "john.smith@example.com"
     }
     
-    print(f"Request Payload:")
-    print(json.dumps(payload, indent=2))
+    out(f"Request Payload:")
+    out(pretty_json(payload))
     
-    response = requests.post(
-        f"{BASE_URL}/api/interview/start",
-        json=payload
-    )
+    response = post_json("/api/interview/start", payload)
     
-    print(f"\nStatus Code: {response.status_code}")
+    out(f"\nStatus Code: {response.status_code}")
     
     if response.status_code == 200:
         data = response.json()
-        print(f"\nQuestion Number: {data['question_number']}")
-        print(f"Category: {data['category']}")
-        print(f"Question:\n{data['question']}")
+        out(f"\nQuestion Number: {data['question_number']}")
+        out(f"Category: {data['category']}")
+        out(f"Question:\n{data['question']}")
         return data
     else:
-        print(f"Error: {response.json()}")
+        out(f"Error: {response.json()}")
         return None
 
 def test_generate_question(interview_type="dentist", question_number=2):
     """Test generating a follow-up question"""
     print_separator(f"Testing Generate Question #{question_number}")
     
-    # Sample conversation history
-    conversation_history = [
-        {
-            "role": "assistant",
-            "content": "Hello John Smith! Thank you for taking the time to speak with us today. To start, could you tell me a bit about your background and what drew you to dentistry?"
-        },
-        {
-            "role": "user",
-            "content": "I graduated from dental school at UCLA in 2020. I was drawn to dentistry because I've always been passionate about combining artistic skills with healthcare. During my undergraduate years, I volunteered at a community health clinic where I saw firsthand the impact of oral health on overall wellbeing."
-        }
-    ]
-    
     payload = {
         "interview_type": interview_type,
-        "conversation_history": conversation_history,
+        "conversation_history": SAMPLE_CONVERSATION_HISTORY,
         "question_number": question_number,
         "user_name": "John Smith"
     }
     
-    print(f"Generating question for category: (will be determined by question number)")
+    out(f"Generating question for category: (will be determined by question number)")
     
-    response = requests.post(
-        f"{BASE_URL}/api/interview/question",
-        json=payload
-    )
+    response = post_json("/api/interview/question", payload)
     
-    print(f"\nStatus Code: {response.status_code}")
+    out(f"\nStatus Code: {response.status_code}")
     
     if response.status_code == 200:
         data = response.json()
-        print(f"\nQuestion Number: {data['question_number']}")
-        print(f"Category: {data['category']}")
-        print(f"Question:\n{data['question']}")
+        out(f"\nQuestion Number: {data['question_number']}")
+        out(f"Category: {data['category']}")
+        out(f"Question:\n{data['question']}")
         return data
     else:
-        print(f"Error: {response.json()}")
+        out(f"Error: {response.json()}")
         return None
 
 def test_generate_audio(text="Hello! This is a test of the audio generation system."):
     """Test audio generation"""
     print_separator("Testing Audio Generation")
     
-    print(f"Text to convert: '{text}'")
+    out(f"Text to convert: '{text}'")
     
-    response = requests.post(
+    with SESSION.post(
         f"{BASE_URL}/api/audio/generate",
-        params={"text": text}
-    )
-    
-    print(f"\nStatus Code: {response.status_code}")
-    
-    if response.status_code == 200:
-        data = response.json()
-        audio_length = len(data['audio_base64'])
-        print(f"Audio generated successfully!")
-        print(f"Base64 length: {audio_length} characters")
-        print(f"Content type: {data['content_type']}")
+        params={"text": text},
+        stream=True
+    ) as response:
+        out(f"\nStatus Code: {response.status_code}")
+        
+        if response.status_code != 200:
+            out(f"Error: {response.json()}")
+            return False
         
-        # Optionally save to file
-        import base64
-        audio_bytes = base64.b64decode(data['audio_base64'])
+        # Stream the MP3 straight to disk instead of buffering it in memory
+        audio_length = 0
         with open('test_audio.mp3', 'wb') as f:
-            f.write(audio_bytes)
-        print("Audio saved to: test_audio.mp3")
+            for chunk in response.iter_content(64 * 1024):
+                f.write(chunk)
+                audio_length += len(chunk)
+        
+        out(f"Audio generated successfully!")
+        out(f"Audio size: {audio_length} bytes")
+        out(f"Content type: {response.headers.get('content-type')}")
+        out("Audio saved to: test_audio.mp3")
         
         return True
-    else:
-        print(f"Error: {response.json()}")
-        return False
 
 def test_complete_interview_flow(interview_type="dentist"):
     """Test a complete interview flow"""
@@ -162,11 +186,11 @@ def test_complete_interview_flow(interview_type="dentist"):
     conversation_history = []
     
     # Start interview
-    print("\n--- Question 1: Starting Interview ---")
+    out("\n--- Question 1: Starting Interview ---")
     start_response = test_start_interview(interview_type)
     
     if not start_response:
-        print("Failed to start interview")
+        out("Failed to start interview")
         return False
     
     conversation_history.append({
@@ -185,55 +209,66 @@ def test_complete_interview_flow(interview_type="dentist"):
         "This interview has helped me reflect on my strengths and areas for growth. I'm genuinely excited about the opportunity to bring my skills to your practice and learn from the experienced team here."
     ]
     
-    # Generate remaining questions
-    for q_num in range(2, 8):
-        print(f"\n--- Question {q_num} ---")
+    # Generate the remaining questions in a single batched request
+    payload = {
+        "interview_type": interview_type,
+        "conversation_history": conversation_history,
+        "answers": sample_answers[1:7],
+        "question_number": 2,
+        "user_name": "John Smith"
+    }
+    
+    response = post_json("/api/interview/questions/batch", payload)
+    
+    if response.status_code != 200:
+        out(f"Error: {response.json()}")
+        return False
+    
+    for answer, data in zip(payload["answers"], response.json()["questions"]):
+        out(f"\n--- Question {data['question_number']} ---")
+        out(f"Category: {data['category']}")
+        out(f"Question: {data['question'][:150]}...")
         
-        # Add user's answer to history
         conversation_history.append({
             "role": "user",
-            "content": sample_answers[q_num - 1]
+            "content": answer
+        })
+        conversation_history.append({
+            "role": "assistant",
+            "content": data['question']
         })
-        
-        # Generate next question
-        payload = {
-            "interview_type": interview_type,
-            "conversation_history": conversation_history,
-            "question_number": q_num,
-            "user_name": "John Smith"
-        }
-        
-        response = requests.post(
-            f"{BASE_URL}/api/interview/question",
-            json=payload
-        )
-        
-        if response.status_code == 200:
-            data = response.json()
-            print(f"Category: {data['category']}")
-            print(f"Question: {data['question'][:150]}...")
-            
-            conversation_history.append({
-                "role": "assistant",
-                "content": data['question']
-            })
-            
-            time.sleep(0.5)  # Small delay between requests
-        else:
-            print(f"Error: {response.json()}")
-            return False
     
-    print("\n✅ Complete interview flow successful!")
-    print(f"Total exchanges: {len(conversation_history)}")
+    out("\n✅ Complete interview flow successful!")
+    out(f"Total exchanges: {len(conversation_history)}")
     return True
 
+def run_test(test_name, test_func):
+    """Run a single test, treating any exception as a failure"""
+    _output.buffer = io.StringIO()
+    try:
+        return test_func()
+    except Exception as e:
+        out(f"\n❌ Error in {test_name}: {str(e)}")
+        return False
+    finally:
+        # One write per test keeps concurrent tests' output from interleaving
+        sys.stdout.write(_output.buffer.getvalue())
+        sys.stdout.flush()
+        _output.buffer = None
+
 def main():
     """Run all tests"""
+    with SESSION:
+        run_tests()
+
+def run_tests():
+    """Run every test against the shared session and print a summary"""
     print("\n" + "🏥"*30)
     print("  DENTAL INTERVIEW PRACTICE API - TEST SUITE")
     print("🏥"*30)
     
-    tests = [
+    # These have no data dependency on each other, so they run concurrently
+    independent_tests = [
         ("Health Check", test_health_check),
         ("Get Categories", test_get_categories),
         ("Get Interview Types", test_get_interview_types),
@@ -242,18 +277,22 @@ def main():
         ("Generate Question #2", lambda: test_generate_question("dentist", 2)),
         ("Generate Question #5", lambda: test_generate_question("dentist", 5)),
         ("Generate Audio", test_generate_audio),
+    ]
+    
+    # Each question here depends on the previous answer, so this stays sequential
+    sequential_tests = [
         ("Complete Interview Flow", lambda: test_complete_interview_flow("dentist")),
     ]
     
-    results = []
+    with ThreadPoolExecutor(max_workers=len(independent_tests)) as executor:
+        futures = [
+            (test_name, executor.submit(run_test, test_name, test_func))
+            for test_name, test_func in independent_tests
+        ]
+        results = [(test_name, future.result()) for test_name, future in futures]
     
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"\n❌ Error in {test_name}: {str(e)}")
-            results.append((test_name, False))
+    for test_name, test_func in sequential_tests:
+        results.append((test_name, run_test(test_name, test_func)))
     
     # Print summary
     print_separator("TEST SUMMARY")
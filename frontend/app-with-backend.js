@@ -66,6 +66,8 @@ function setupEventListeners() {
     elements.userName.addEventListener('input', validateInputs);
     elements.userEmail.addEventListener('input', validateInputs);
     elements.questionAudio.addEventListener('ended', handleAudioEnded);
+    // Audio is now fetched by URL; if that fails, don't leave recording disabled
+    elements.questionAudio.addEventListener('error', handleAudioEnded);
     
     if (typeof lucide !== 'undefined') {
         lucide.createIcons();
@@ -209,10 +211,10 @@ async function generateFirstQuestion() {
         updateRecordingControls(); // Update controls now that question is ready
         
         // Handle audio if available, without blocking the question display
-        if (data.audio_base64) {
+        if (data.audio_url) {
             console.log('Audio received with question, preparing playback...');
             // Start audio generation in the background
-            handleReceivedAudio(data.audio_base64);
+            handleReceivedAudio(data.audio_url);
         } else {
             state.isGeneratingAudio = false; // If audio is not available, proceed without it
             updateRecordingControls(); // Enable recording if no audio is needed
@@ -229,11 +231,10 @@ async function generateFirstQuestion() {
 }
 
 
-function handleReceivedAudio(audioBase64) {
+function handleReceivedAudio(audioPath) {
     try {
-        // Convert base64 to blob and create URL
-        const audioBlob = base64ToBlob(audioBase64, 'audio/mpeg');
-        const audioUrl = URL.createObjectURL(audioBlob);
+        // The browser fetches (and caches) the MP3 itself, no base64 decoding needed
+        const audioUrl = `${CONFIG.API_BASE_URL}${audioPath}`;
         
         state.audioUrl = audioUrl;
         
@@ -249,18 +250,6 @@ function handleReceivedAudio(audioBase64) {
     }
 }
 
-function base64ToBlob(base64, mimeType) {
-    const byteCharacters = atob(base64);
-    const byteNumbers = new Array(byteCharacters.length);
-    
-    for (let i = 0; i < byteCharacters.length; i++) {
-        byteNumbers[i] = byteCharacters.charCodeAt(i);
-    }
-    
-    const byteArray = new Uint8Array(byteNumbers);
-    return new Blob([byteArray], { type: mimeType });
-}
-
 function playAudio(url) {
     if (elements.questionAudio) {
         elements.questionAudio.src = url || state.audioUrl;
@@ -451,10 +440,10 @@ async function generateNextQuestion(history) {
         updateRecordingControls(); // Enable recording controls now that question is ready
         
         // Handle audio if available, without blocking the question display
-        if (data.audio_base64) {
+        if (data.audio_url) {
             console.log('Audio received with question, preparing playback...');
             // Start audio generation in the background
-            handleReceivedAudio(data.audio_base64);
+            handleReceivedAudio(data.audio_url);
         } else {
             state.isGeneratingAudio = false; // If audio is not available, proceed without it
             updateRecordingControls(); // Enable recording if no audio is needed
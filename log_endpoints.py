@@ -3,35 +3,65 @@ API Endpoints for Log Viewing
 Add these to your main.py file
 """
 
-from fastapi import Query
-from fastapi.responses import HTMLResponse
+from fastapi import Query, Request
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response, StreamingResponse
 from datetime import datetime
 from typing import Optional
-from log_handler import log_capture, setup_log_capture
+import os
+import hashlib
+import asyncio
+import orjson
+from log_handler import log_capture, setup_log_capture, stop_log_capture
 
 # Add this near the top of your main.py, after creating the logger
 # setup_log_capture(logger)
 
+# ...and stop its background thread on shutdown so queued logs are flushed
+@app.on_event("shutdown")
+def shutdown_log_capture():
+    """Flush queued log records and stop the log capture thread"""
+    stop_log_capture()
+
+# The log viewer page is static, so read it once instead of on every request
+LOGS_HTML_PATH = os.path.join(os.path.dirname(__file__), "logs.html")
+LOGS_HTML = None
+LOGS_HTML_ETAG = None
+if os.path.exists(LOGS_HTML_PATH):
+    with open(LOGS_HTML_PATH, 'r', encoding='utf-8') as f:
+        LOGS_HTML = f.read()
+    LOGS_HTML_ETAG = f'"{hashlib.sha1(LOGS_HTML.encode()).hexdigest()}"'
+
+# Seconds of silence before the live log stream sends a heartbeat
+LOG_SSE_HEARTBEAT_SECONDS = 15
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the client's If-None-Match header already carries this ETag"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))
+
 @app.get("/logs", response_class=HTMLResponse)
-async def serve_logs_page():
+async def serve_logs_page(request: Request):
     """Serve the log viewer HTML page"""
-    import os
-    logs_html_path = os.path.join(os.path.dirname(__file__), "logs.html")
-    
-    if os.path.exists(logs_html_path):
-        with open(logs_html_path, 'r') as f:
-            return HTMLResponse(content=f.read())
+    if LOGS_HTML is not None:
+        headers = {"ETag": LOGS_HTML_ETAG, "Cache-Control": "no-cache"}
+        if etag_matches(request, LOGS_HTML_ETAG):
+            return Response(status_code=304, headers=headers)
+        return HTMLResponse(content=LOGS_HTML, headers=headers)
     else:
         return HTMLResponse(
             content="<h1>Log viewer not found</h1><p>Please ensure logs.html exists in the same directory as main.py</p>",
             status_code=404
         )
 
-@app.get("/api/logs")
+@app.get("/api/logs", response_class=ORJSONResponse)
 async def get_logs(
     limit: Optional[int] = Query(100, ge=1, le=1000, description="Maximum number of logs to return"),
     level: Optional[str] = Query(None, description="Filter by log level (INFO, WARNING, ERROR, SUCCESS, DEBUG)"),
-    since: Optional[str] = Query(None, description="ISO timestamp - only return logs after this time")
+    since: Optional[str] = Query(None, description="ISO timestamp - only return logs after this time"),
+    since_epoch: Optional[float] = Query(None, description="Unix epoch seconds - only return logs after this time"),
+    after_seq: Optional[int] = Query(None, ge=0, description="Cursor from a previous response - only return newer logs")
 ):
     """
     Get application logs with optional filtering
@@ -40,18 +70,22 @@ async def get_logs(
     - limit: Maximum number of logs to return (1-1000, default 100)
     - level: Filter by log level (INFO, WARNING, ERROR, SUCCESS, DEBUG)
     - since: ISO timestamp - only return logs after this time
+    - since_epoch: Unix epoch seconds, compared directly against each log's 'created' time
+    - after_seq: the 'cursor' from a previous response - only return logs captured since then
     """
     try:
         since_dt = None
         if since:
             since_dt = datetime.fromisoformat(since)
         
-        logs = log_capture.get_logs(limit=limit, level=level, since=since_dt)
+        logs = log_capture.get_logs(limit=limit, level=level, since=since_dt,
+                                    since_epoch=since_epoch, after_seq=after_seq)
         
         return {
             "success": True,
             "count": len(logs),
-            "logs": logs
+            "logs": logs,
+            "cursor": logs[-1]['seq'] if logs else (after_seq or 0)
         }
     except Exception as e:
         logger.error(f"Error fetching logs: {str(e)}")
@@ -61,19 +95,31 @@ async def get_logs(
             "logs": []
         }
 
-@app.get("/api/logs/stats")
-async def get_log_stats():
+@app.get("/api/logs/stats", response_class=ORJSONResponse)
+async def get_log_stats(request: Request):
     """
     Get statistics about application logs
     
-    Returns counts by level, total logs, and timestamp range
+    Returns counts by level, total logs, and timestamp range.
+    Responds 304 Not Modified when the client's ETag is still current.
     """
     try:
         stats = log_capture.get_stats()
-        return {
-            "success": True,
-            "stats": stats
-        }
+        
+        # Stats only change when a log is captured or cleared, so the
+        # total plus newest timestamp identifies this exact body
+        etag = f'W/"{stats["total"]}-{stats["newest"]}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers=headers)
+        
+        return ORJSONResponse(
+            content={
+                "success": True,
+                "stats": stats
+            },
+            headers=headers
+        )
     except Exception as e:
         logger.error(f"Error fetching log stats: {str(e)}")
         return {
@@ -81,7 +127,7 @@ async def get_log_stats():
             "error": str(e)
         }
 
-@app.delete("/api/logs")
+@app.delete("/api/logs", response_class=ORJSONResponse)
 async def clear_logs():
     """
     Clear all captured logs
@@ -102,23 +148,20 @@ async def clear_logs():
             "error": str(e)
         }
 
-@app.get("/api/logs/stream")
-async def stream_logs(since: Optional[str] = Query(None)):
+@app.get("/api/logs/stream", response_class=ORJSONResponse)
+async def stream_logs(after_seq: int = Query(0, ge=0, description="Cursor returned by the previous poll")):
     """
-    Get new logs since a specific timestamp
-    Useful for polling-based real-time updates
+    Get logs captured after a cursor
+    Useful for polling-based real-time updates: pass the returned cursor back on the next poll
     """
     try:
-        since_dt = None
-        if since:
-            since_dt = datetime.fromisoformat(since)
-        
-        logs = log_capture.get_logs(since=since_dt)
+        logs = log_capture.get_logs(after_seq=after_seq)
         
         return {
             "success": True,
             "count": len(logs),
             "logs": logs,
+            "cursor": logs[-1]['seq'] if logs else after_seq,
             "timestamp": datetime.now().isoformat()
         }
     except Exception as e:
@@ -127,4 +170,32 @@ async def stream_logs(since: Optional[str] = Query(None)):
             "success": False,
             "error": str(e),
             "logs": []
-        }
\ No newline at end of file
+        }
+
+@app.get("/api/logs/sse")
+async def stream_logs_sse():
+    """
+    Push each new log entry to the client as a Server-Sent Event
+    
+    Replaces polling /api/logs/stream with one long-lived connection.
+    A comment line is sent as a heartbeat when no logs arrive for a while.
+    """
+    queue = log_capture.subscribe()
+    
+    async def event_stream():
+        try:
+            while True:
+                try:
+                    entry = await asyncio.wait_for(queue.get(), timeout=LOG_SSE_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": heartbeat\n\n"
+                    continue
+                yield b"data: " + orjson.dumps(entry) + b"\n\n"
+        finally:
+            log_capture.unsubscribe(queue)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
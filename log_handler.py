@@ -4,10 +4,40 @@ Captures application logs and makes them available via API
 """
 
 import logging
+import asyncio
+import queue
+import bisect
 from collections import deque
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from datetime import datetime
+from itertools import islice
 from typing import List, Dict, Optional
-import json
+
+# Levels that get their own bucket up front (others are added on first use)
+LOG_LEVELS = ('INFO', 'WARNING', 'ERROR', 'SUCCESS', 'DEBUG')
+
+
+class _EntryKeys:
+    """Sequence view over a log buffer exposing one sorted field of each entry for bisect"""
+    
+    def __init__(self, entries, key: str):
+        self.entries = entries
+        self.key = key
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def __getitem__(self, index):
+        return self.entries[index][self.key]
+
+
+def _offer(queue: asyncio.Queue, log_entry: Dict):
+    """Put an entry on a subscriber queue, dropping it if the client is too far behind"""
+    try:
+        queue.put_nowait(log_entry)
+    except asyncio.QueueFull:
+        pass
+
 
 class LogCapture(logging.Handler):
     """Custom logging handler that captures logs in memory for API access"""
@@ -16,26 +46,78 @@ class LogCapture(logging.Handler):
         super().__init__()
         self.max_logs = max_logs
         self.logs = deque(maxlen=max_logs)
+        # Same entries as self.logs, bucketed by level in arrival order
+        self.by_level = {level: deque() for level in LOG_LEVELS}
+        # Live stream subscribers: queue -> the event loop that owns it
+        self.subscribers = {}
+        # Sequence number of the last captured entry; never reset, so
+        # client cursors stay valid across clear()
+        self.last_seq = 0
         
     def emit(self, record):
         """Capture log record"""
         try:
+            self.last_seq += 1
             log_entry = {
+                'seq': self.last_seq,
                 'timestamp': datetime.fromtimestamp(record.created).isoformat(),
+                'created': record.created,
                 'level': record.levelname,
-                'message': self.format(record),
+                'message': None,
                 'module': record.module,
                 'function': record.funcName,
                 'line': record.lineno
             }
+            if record.exc_info or self.subscribers:
+                # Format now so the traceback (and its frames) isn't kept
+                # alive, or because live subscribers need the message anyway
+                log_entry['message'] = self.format(record)
+            else:
+                # Most entries are evicted or never read, so format on demand
+                log_entry['_record'] = record
+            # The deque is about to drop its oldest entry, which is also
+            # the oldest entry in that entry's level bucket
+            if len(self.logs) == self.max_logs:
+                evicted = self.logs[0]
+                self.by_level[evicted['level']].popleft()
             self.logs.append(log_entry)
+            self.by_level.setdefault(record.levelname, deque()).append(log_entry)
+            self._broadcast(log_entry)
         except Exception:
             self.handleError(record)
     
+    def _broadcast(self, log_entry: Dict):
+        """Hand a new entry to every live subscriber's event loop"""
+        for subscriber, loop in list(self.subscribers.items()):
+            try:
+                loop.call_soon_threadsafe(_offer, subscriber, log_entry)
+            except RuntimeError:
+                # The subscriber's loop has been closed
+                self.subscribers.pop(subscriber, None)
+    
+    def subscribe(self, max_pending: int = 1000) -> asyncio.Queue:
+        """
+        Register a queue that receives every log entry captured from now on
+        
+        Must be called from inside the event loop that will read the queue.
+        Entries are dropped for a subscriber that falls max_pending behind.
+        """
+        subscriber = asyncio.Queue(maxsize=max_pending)
+        with self.lock:
+            self.subscribers[subscriber] = asyncio.get_running_loop()
+        return subscriber
+    
+    def unsubscribe(self, subscriber: asyncio.Queue):
+        """Stop delivering log entries to a queue returned by subscribe()"""
+        with self.lock:
+            self.subscribers.pop(subscriber, None)
+    
     def get_logs(self, 
                  limit: Optional[int] = None, 
                  level: Optional[str] = None,
-                 since: Optional[datetime] = None) -> List[Dict]:
+                 since: Optional[datetime] = None,
+                 since_epoch: Optional[float] = None,
+                 after_seq: Optional[int] = None) -> List[Dict]:
         """
         Get captured logs with optional filtering
         
@@ -43,58 +125,115 @@ class LogCapture(logging.Handler):
             limit: Maximum number of logs to return
             level: Filter by log level (INFO, WARNING, ERROR, etc.)
             since: Only return logs after this timestamp
+            since_epoch: Same as since, as Unix epoch seconds
+            after_seq: Only return logs with a larger 'seq' (a polling cursor)
         """
-        logs = list(self.logs)
-        
-        # Filter by level
-        if level:
-            logs = [log for log in logs if log['level'] == level.upper()]
+        if since is not None:
+            since_epoch = since.timestamp()
         
-        # Filter by timestamp
-        if since:
-            since_iso = since.isoformat()
-            logs = [log for log in logs if log['timestamp'] > since_iso]
-        
-        # Apply limit
-        if limit:
-            logs = logs[-limit:]
-        
-        return logs
+        with self.lock:
+            if level:
+                source = self.by_level.get(level.upper(), ())
+            else:
+                source = self.logs
+            
+            # Entries are stored in capture order, so both cursors are binary searches
+            start = 0
+            if since_epoch is not None:
+                start = bisect.bisect_right(_EntryKeys(source, 'created'), since_epoch)
+            if after_seq is not None:
+                start = max(start, bisect.bisect_right(_EntryKeys(source, 'seq'), after_seq))
+            
+            # Apply limit
+            if limit:
+                start = max(start, len(source) - limit)
+            
+            return self._with_messages(list(islice(source, start, None)))
+    
+    def _with_messages(self, entries: List[Dict]) -> List[Dict]:
+        """Format the message of any entries that haven't been read yet"""
+        for entry in entries:
+            record = entry.pop('_record', None)
+            if record is not None:
+                entry['message'] = self.format(record)
+        return entries
     
     def get_stats(self) -> Dict:
         """Get statistics about captured logs"""
-        logs = list(self.logs)
-        
-        return {
-            'total': len(logs),
-            'by_level': {
-                'INFO': sum(1 for log in logs if log['level'] == 'INFO'),
-                'WARNING': sum(1 for log in logs if log['level'] == 'WARNING'),
-                'ERROR': sum(1 for log in logs if log['level'] == 'ERROR'),
-                'SUCCESS': sum(1 for log in logs if log['level'] == 'SUCCESS'),
-                'DEBUG': sum(1 for log in logs if log['level'] == 'DEBUG'),
-            },
-            'oldest': logs[0]['timestamp'] if logs else None,
-            'newest': logs[-1]['timestamp'] if logs else None,
-        }
+        with self.lock:
+            return {
+                'total': len(self.logs),
+                'by_level': {level: len(self.by_level[level]) for level in LOG_LEVELS},
+                'oldest': self.logs[0]['timestamp'] if self.logs else None,
+                'newest': self.logs[-1]['timestamp'] if self.logs else None,
+            }
     
     def clear(self):
         """Clear all captured logs"""
-        self.logs.clear()
+        with self.lock:
+            self.logs.clear()
+            for bucket in self.by_level.values():
+                bucket.clear()
 
 
 # Global log capture instance
 log_capture = LogCapture(max_logs=1000)
 
-def setup_log_capture(logger: logging.Logger):
+class _InProcessQueueHandler(QueueHandler):
+    """QueueHandler that enqueues records for a listener in this process"""
+    
+    def prepare(self, record):
+        # Interpolate the args now, while they still hold the values they had
+        # when the record was logged. Unlike the stock prepare() the record
+        # keeps exc_info, since it never has to be pickled across processes
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# Background thread feeding log_capture, started by setup_log_capture
+log_listener: Optional[QueueListener] = None
+
+
+def setup_log_capture(logger: logging.Logger, log_file: Optional[str] = None):
     """
     Setup log capture for a logger
     
+    Records are put on a queue and handed to log_capture by a background
+    thread, so capturing never runs on the thread that logged.
+    
     Args:
         logger: The logger instance to capture logs from
+        log_file: Optional path that the same thread also appends logs to,
+            rotated at 10 MB with 3 backups
     """
+    global log_listener
     log_capture.setLevel(logging.INFO)
     formatter = logging.Formatter('%(message)s')
     log_capture.setFormatter(formatter)
-    logger.addHandler(log_capture)
-    return log_capture
\ No newline at end of file
+    
+    log_queue = queue.SimpleQueue()
+    queue_handler = _InProcessQueueHandler(log_queue)
+    queue_handler.setLevel(logging.INFO)
+    logger.addHandler(queue_handler)
+    
+    handlers = [log_capture]
+    if log_file:
+        file_handler = RotatingFileHandler(log_file, maxBytes=10 * 1024 * 1024, backupCount=3, encoding='utf-8')
+        file_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+        handlers.append(file_handler)
+    
+    log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    log_listener.start()
+    return log_capture
+
+
+def stop_log_capture():
+    """Stop the background listener, capturing anything still queued"""
+    global log_listener
+    if log_listener is not None:
+        log_listener.stop()
+        for handler in log_listener.handlers:
+            if handler is not log_capture:
+                handler.close()
+        log_listener = None
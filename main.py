@@ -3,28 +3,36 @@ Dental Interview Practice - Backend API
 FastAPI application for AI-powered dental interview practice
 """
 
-from fastapi import FastAPI, HTTPException, UploadFile, File
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi import BackgroundTasks, FastAPI, HTTPException, UploadFile, File, Query, Request
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, EmailStr
-from typing import List, Dict, Literal
+from typing import Callable, List, Dict, Literal, Optional, Sequence, Tuple, Union
 import openai
-from fastapi import Query
-import requests
+import httpx
 import os
+import hashlib
+import gzip
+import io
+import secrets
+from collections import OrderedDict
 from dotenv import load_dotenv
 import logging
-import json
-from log_handler import log_capture, setup_log_capture
+import asyncio
+import random
+import re
+import time
+import orjson
+from log_handler import log_capture, setup_log_capture, stop_log_capture
+from middleware import CORSMiddleware, SelectiveGZipMiddleware, UploadSizeLimitMiddleware
+from static_files import CachedStaticFiles
+from tts_cache import TTSCache, tts_cache_key
+from semantic_cache import SemanticCache
 from datetime import datetime
-from typing import Optional
-from typing import Optional
 from scoring_rubrics import (
     get_rubric_for_category, 
-    calculate_weighted_score, 
-    format_rubric_for_prompt,
-    ScoringCriteria
+    calculate_category_score, 
+    get_rubric_prompt_for_category,
+    DEFAULT_RUBRIC
 )
 
 # Load environment variables
@@ -34,65 +42,252 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+# Per-request access lines are noise at production traffic levels
+if os.getenv("ENVIRONMENT") == "production":
+    logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
+
+# Log section separators
+SEP = "=" * 80
+SUBSEP = "-" * 80
 
 # Setup log capture for live viewing
-setup_log_capture(logger)
+# LOG_FILE optionally persists the same logs to a rotating file
+setup_log_capture(logger, log_file=os.getenv("LOG_FILE"))
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Dental Interview Practice API",
     description="AI-powered interview practice for dental professionals",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
+# Whisper rejects audio over 25 MB, so refuse bigger uploads before reading them.
+# Added before CORS so the 413 still carries CORS headers for the frontend
+MAX_AUDIO_UPLOAD_BYTES = 25 * 1024 * 1024
+app.add_middleware(UploadSizeLimitMiddleware, max_bytes=MAX_AUDIO_UPLOAD_BYTES, paths=["/api/audio/transcribe"])
+
 # CORS middleware
+# FRONTEND_ORIGIN is a comma-separated list of origins allowed to call the API.
+# Credentials are only allowed for explicit origins; "*" with credentials is
+# rejected by browsers. Preflight results are cached by the browser for a day.
+FRONTEND_ORIGINS = [origin.strip() for origin in os.getenv("FRONTEND_ORIGIN", "*").split(",") if origin.strip()]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify your frontend domain
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=FRONTEND_ORIGINS,
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=86400,
 )
 
+# Compress JSON/HTML responses (log polling returns highly repetitive JSON)
+app.add_middleware(SelectiveGZipMiddleware, minimum_size=1024, compresslevel=5)
+
+@app.on_event("shutdown")
+def shutdown_log_capture():
+    """Flush queued log records and stop the log capture thread"""
+    stop_log_capture()
+
+@app.on_event("startup")
+async def prewarm_intro_audio():
+    """Synthesize the fixed interview openings in the background"""
+    if ELEVENLABS_API_KEY:
+        app.state.intro_audio_task = asyncio.create_task(load_warm_intro_audio())
+
+@app.on_event("shutdown")
+async def close_http_clients():
+    """Close pooled connections to external APIs"""
+    await TTS_CLIENT.aclose()
+    await aclient.close()
+
 # Mount static files FIRST (before defining routes)
 # This serves CSS, JS, and other static files
 current_dir = os.path.dirname(os.path.abspath(__file__))
 
-possible_frontend_dirs = [
-    os.path.join(current_dir, "..", "frontend"),  # ../frontend (if main.py in backend/)
-    os.path.join(current_dir, "frontend"),         # frontend/ (if main.py in files/)
-    current_dir,                                   # same directory as main.py
-]
+# FRONTEND_DIR pins the frontend location; otherwise the usual layouts are tried
+FRONTEND_DIR = os.getenv("FRONTEND_DIR")
+if FRONTEND_DIR:
+    possible_frontend_dirs = [FRONTEND_DIR]
+else:
+    possible_frontend_dirs = [
+        os.path.join(current_dir, "..", "frontend"),  # ../frontend (if main.py in backend/)
+        os.path.join(current_dir, "frontend"),         # frontend/ (if main.py in files/)
+        current_dir,                                   # same directory as main.py
+    ]
 
-frontend_dir = None
-for dir_path in possible_frontend_dirs:
-    logger.info(f"Checking for static files in: {dir_path} - Exists: {os.path.exists(dir_path)}")
-    if os.path.exists(dir_path):
-        # Check if it actually has frontend files
-        test_files = ["index.html", "styles.css"]
-        if any(os.path.exists(os.path.join(dir_path, f)) for f in test_files):
-            frontend_dir = dir_path
-            break
+def list_dir(dir_path: str) -> set:
+    """File names in a directory (empty if it doesn't exist), from a single scandir"""
+    try:
+        with os.scandir(dir_path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+# One listing per candidate; the checks below are set lookups, not stat calls
+frontend_dir_listings = {dir_path: list_dir(dir_path) for dir_path in possible_frontend_dirs}
+logger.info(f"Checking for static files in: {possible_frontend_dirs}")
+if FRONTEND_DIR and "index.html" not in frontend_dir_listings[FRONTEND_DIR]:
+    # A configured location that is wrong should stop startup, not serve an error page
+    raise RuntimeError(f"FRONTEND_DIR has no index.html: {FRONTEND_DIR}")
+
+# Check if it actually has frontend files
+frontend_dir = next(
+    (dir_path for dir_path, names in frontend_dir_listings.items() if names & {"index.html", "styles.css"}),
+    None
+)
 
+static_files = None
 if frontend_dir:
     try:
-        app.mount("/static", StaticFiles(directory=frontend_dir), name="static")
+        static_files = CachedStaticFiles(directory=frontend_dir)
+        app.mount("/static", static_files, name="static")
         logger.info(f"✅ Serving static files from: {frontend_dir}")
     except Exception as e:
         logger.error(f"❌ Error mounting static files: {e}")
 else:
     logger.warning(f"⚠️ Frontend directory not found. Checked: {possible_frontend_dirs}")
 
+# Resolve and read index.html once instead of probing the filesystem on every GET /
+possible_index_paths = [os.path.join(dir_path, "index.html") for dir_path in possible_frontend_dirs]
+FRONTEND_INDEX_PATH = next(
+    (os.path.join(dir_path, "index.html") for dir_path, names in frontend_dir_listings.items() if "index.html" in names),
+    None
+)
+FRONTEND_INDEX_HTML = None
+FRONTEND_INDEX_GZIP = None
+FRONTEND_INDEX_ETAG = None
+if FRONTEND_INDEX_PATH:
+    with open(FRONTEND_INDEX_PATH, 'rb') as f:
+        FRONTEND_INDEX_HTML = f.read()
+    if static_files is not None:
+        # Fingerprinted asset URLs let browsers cache CSS/JS indefinitely
+        FRONTEND_INDEX_HTML = static_files.versioned_urls(FRONTEND_INDEX_HTML)
+    FRONTEND_INDEX_GZIP = gzip.compress(FRONTEND_INDEX_HTML, compresslevel=9, mtime=0)
+    FRONTEND_INDEX_ETAG = f'"{hashlib.sha1(FRONTEND_INDEX_HTML).hexdigest()}"'
+    logger.info(f"✅ Serving frontend from: {FRONTEND_INDEX_PATH}")
+
 # API Keys
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 ELEVENLABS_API_KEY = os.getenv("ELEVENLABS_API_KEY")
 ELEVENLABS_VOICE_ID = os.getenv("ELEVENLABS_VOICE_ID", "21m00Tcm4TlvDq8ikWAM")
 
+# Idle connections are kept for 5 minutes (httpx's default is 5 seconds), so
+# they survive the time a candidate spends answering between questions
+KEEPALIVE_EXPIRY = 300
+
+# Shared ElevenLabs client: keeps connections alive between TTS calls
+# instead of a new TCP+TLS handshake per question
+TTS_CLIENT = httpx.AsyncClient(
+    http2=True,
+    timeout=30,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=32, keepalive_expiry=KEEPALIVE_EXPIRY)
+)
+
+# ElevenLabs answers worth another attempt: rate limiting and transient
+# server errors. Retries back off exponentially with jitter (1s, 2s, 4s...
+# capped at 8s) unless the response says how long to wait
+TTS_RETRY_STATUSES = {429, 500, 502, 503, 504}
+TTS_MAX_ATTEMPTS = 4
+TTS_RETRY_MAX_WAIT = 8.0
+
+# Voice parameters for generated question audio
+TTS_MODEL_ID = "eleven_monolingual_v1"
+TTS_VOICE_SETTINGS = {
+    "stability": 0.5,
+    "similarity_boost": 0.75,
+    "style": 0.0,
+    "use_speaker_boost": True
+}
+
+TTS_VOICE_SETTINGS_KEY = orjson.dumps(TTS_VOICE_SETTINGS, option=orjson.OPT_SORT_KEYS).decode()
+
+# ElevenLabs endpoints and headers are the same for every request
+TTS_URL = f"https://api.elevenlabs.io/v1/text-to-speech/{ELEVENLABS_VOICE_ID}"
+TTS_STREAM_URL = f"{TTS_URL}/stream"  # Sends audio as it is synthesized
+TTS_HEADERS = {
+    "Accept": "audio/mpeg",
+    "Accept-Encoding": "identity",  # MP3 is already compressed; relay it unchanged
+    "Content-Type": "application/json",
+    "xi-api-key": ELEVENLABS_API_KEY or ""
+}
+
+# Streamed speech is deterministic enough per text to let browsers keep it
+AUDIO_CACHE_CONTROL = "public, max-age=86400"
+
+# /api/audio/stream trades a little quality for time to first audio byte
+STREAMING_TTS_MODEL_ID = "eleven_turbo_v2"
+STREAMING_TTS_LATENCY = 3
+
+# Generated audio keyed by voice/model/settings/text, so recurring
+# greetings and questions skip ElevenLabs entirely. The disk copy is capped
+# at TTS_CACHE_MAX_MB, dropping the least recently used clips first
+tts_cache = TTSCache(
+    max_items=512,
+    cache_dir=os.getenv("TTS_CACHE_DIR", "/tmp/tts"),
+    max_disk_bytes=int(os.getenv("TTS_CACHE_MAX_MB", "512")) * 1024 * 1024
+)
+
+# First questions open with one of these sentences. Their audio is made at
+# startup, so only the greeting and the question itself need synthesizing
+WARM_INTRO_OPENINGS = [
+    "Thank you for taking the time to speak with us today.",
+    "It's great to meet you, and thanks for joining us today.",
+    "Welcome, and thank you for making the time to talk with us.",
+    "I'm glad we could find time to talk today.",
+]
+WARM_INTRO_PATTERN = re.compile("|".join(re.escape(opening) for opening in WARM_INTRO_OPENINGS))
+WARM_INTRO_AUDIO: Dict[str, bytes] = {}
+
+# Introductory questions for the first turn. Only the greeting varies with the
+# candidate, so /api/interview/start picks one of these instead of asking the
+# model (pass force_generate=true to generate one). Their audio is made at
+# startup along with the openings
+FIRST_QUESTIONS = {
+    "dentist": [
+        "To start us off, could you walk me through your journey into dentistry and what drew you to this field?",
+        "Could you tell me a bit about your clinical background and the kind of dentistry you enjoy most?",
+        "What first sparked your interest in dentistry, and how has that shaped the dentist you are today?",
+        "Could you give me an overview of your experience so far and what you're looking for in your next practice?",
+        "Tell me about the path that led you to dentistry, and what keeps you motivated in your day-to-day work.",
+        "Before we get into specifics, what are you most proud of in your career as a dentist so far?",
+    ],
+    "hygienist": [
+        "To start us off, could you walk me through your journey into dental hygiene and what drew you to this field?",
+        "Could you tell me a bit about your clinical background and the kind of patient care you enjoy most?",
+        "What first sparked your interest in dental hygiene, and how has that shaped the hygienist you are today?",
+        "Could you give me an overview of your experience so far and what you're looking for in your next practice?",
+        "Tell me about the path that led you to dental hygiene, and what keeps you motivated in your day-to-day work.",
+        "Before we get into specifics, what are you most proud of in your career as a hygienist so far?",
+    ],
+}
+
+def compose_first_question(user_name: str, interview_type: str) -> str:
+    """Greeting, a prewarmed opening and a prepared introductory question"""
+    opening = random.choice(WARM_INTRO_OPENINGS)
+    question = random.choice(FIRST_QUESTIONS[interview_type])
+    return f"Hi {user_name}! {opening} {question}"
+
+# Question audio handed to the browser by URL, keyed by a hash of the MP3.
+# Follow-up questions are unique per session, so these stay in memory only
+AUDIO_URL_PREFIX = "/api/audio/"
+audio_blobs = TTSCache(max_items=256)
+
 # Initialize OpenAI client
-openai.api_key = OPENAI_API_KEY
+# One async client for every OpenAI call (chat, embeddings, Whisper), so a
+# slow model call doesn't block other requests. Its HTTP/2 pool keeps
+# connections warm and lets concurrent calls share them. A missing key only
+# fails when a request is made.
+OPENAI_HTTP_CLIENT = httpx.AsyncClient(
+    http2=True,
+    timeout=60,
+    limits=httpx.Limits(max_connections=200, max_keepalive_connections=50, keepalive_expiry=KEEPALIVE_EXPIRY)
+)
+aclient = openai.AsyncOpenAI(
+    api_key=OPENAI_API_KEY or "",
+    max_retries=3,  # Backoff with jitter on 429/5xx, honouring Retry-After
+    timeout=30.0,
+    http_client=OPENAI_HTTP_CLIENT
+)
 
 # Interview categories in order
 INTERVIEW_CATEGORIES = [
@@ -107,10 +302,11 @@ INTERVIEW_CATEGORIES = [
     "Fit & Professional Maturity",
     "Insight & Authenticity"
 ]
+CATEGORY_BY_QNUM = {number: category for number, category in enumerate(INTERVIEW_CATEGORIES, 1)}
 
-# System prompts for different interview types
-SYSTEM_PROMPTS = {
-    "dentist": """You are an experienced dental practice manager conducting a professional interview for a dentist position. 
+# System prompts for different interview types: one shared template, with the
+# role, its practice area and its category themes filled in per type
+SYSTEM_PROMPT_TEMPLATE = """You are an experienced dental practice manager conducting a professional interview for a {position} position.
 
 Your role is to ask thoughtful, relevant questions across ten specific categories in order:
 1. Introduction - Getting to know the candidate
@@ -135,7 +331,7 @@ QUESTION GENERATION PHILOSOPHY:
 - Create UNIQUE questions for each interview - no repeating the same questions across sessions
 - Mix question formats: scenarios, hypotheticals, technical deep-dives, ethical dilemmas, direct inquiries, "what if" situations
 - Be spontaneous and natural - avoid templated language
-- Draw from the full breadth of dental practice (not just common topics)
+- Draw from the full breadth of {practice} (not just common topics)
 - Vary complexity - some questions direct, others multi-layered
 - Make questions feel conversational, not scripted
 
@@ -143,13 +339,45 @@ USING CANDIDATE'S JOURNEY (CRITICAL):
 - YOU HAVE ACCESS TO THE ENTIRE CONVERSATION HISTORY - USE IT!
 - Reference specific details the candidate mentioned in previous answers when relevant
 - Build on their previous responses to create continuity
-- If they mentioned a practice type, specialty interest, or experience - weave it into new questions naturally
+- If they mentioned a practice type, {background}, or experience - weave it into new questions naturally
 - Create personalized scenarios based on their background
 - Make the interview feel like a natural conversation, not isolated questions
 
 CATEGORY THEMES (use as broad inspiration, not as rigid templates):
 
-1. Introduction: 
+{category_themes}
+
+PERSONALIZATION RULES:
+- ONLY reference what the candidate ACTUALLY said
+- DO NOT invent or assume experiences they didn't mention
+- If they said "no experience with X" → Don't reference X as their expertise
+- If they said "interested in X" → Can ask about interest, not experience
+- Verify accuracy before personalizing
+- When in doubt, ask a fresh standalone question
+
+ACKNOWLEDGMENT VARIETY:
+NEVER repeat phrases. Use different language each time:
+- Reference specific details they mentioned
+- Acknowledge their reasoning or approach
+- Note interesting aspects of their answer
+- Build naturally into the next question
+- Avoid overused phrases like "thank you for sharing"
+
+Guidelines:
+- Ask ONE question at a time
+- ALWAYS acknowledge the candidate's previous answer briefly before the next question
+- Keep questions conversational yet professionally rigorous
+- Do not mention category names in your questions
+- Maintain a supportive tone with honest feedback
+- GENERATE COMPLETELY NEW QUESTIONS for each interview session
+- Make every question feel fresh, natural, and unrehearsed"""
+
+ROLE_PROMPT_DETAILS = {
+    "dentist": {
+        "position": "dentist",
+        "practice": "dental practice",
+        "background": "specialty interest",
+        "category_themes": """1. Introduction:
    Core focus: Understanding their background, motivations, career path, interests
    Be creative: Ask about their journey in unexpected ways, recent learning experiences, what drew them to dentistry, practice preferences
 
@@ -187,73 +415,13 @@ CATEGORY THEMES (use as broad inspiration, not as rigid templates):
 
 10. Insight & Authenticity:
     Core focus: Honest self-reflection, awareness of strengths/weaknesses, accepting feedback
-    Be creative: Explore growth areas, valuable feedback they've received, career reflections, honest assessment
-
-PERSONALIZATION RULES:
-- ONLY reference what the candidate ACTUALLY said
-- DO NOT invent or assume experiences they didn't mention
-- If they said "no experience with X" → Don't reference X as their expertise
-- If they said "interested in X" → Can ask about interest, not experience
-- Verify accuracy before personalizing
-- When in doubt, ask a fresh standalone question
-
-ACKNOWLEDGMENT VARIETY:
-NEVER repeat phrases. Use different language each time:
-- Reference specific details they mentioned
-- Acknowledge their reasoning or approach
-- Note interesting aspects of their answer
-- Build naturally into the next question
-- Avoid overused phrases like "thank you for sharing"
-
-Guidelines:
-- Ask ONE question at a time
-- ALWAYS acknowledge the candidate's previous answer briefly before the next question
-- Keep questions conversational yet professionally rigorous
-- Do not mention category names in your questions
-- Maintain a supportive tone with honest feedback
-- GENERATE COMPLETELY NEW QUESTIONS for each interview session
-- Make every question feel fresh, natural, and unrehearsed""",
-
-    "hygienist": """You are an experienced dental practice manager conducting a professional interview for a dental hygienist position.
-
-Your role is to ask thoughtful, relevant questions across ten specific categories in order:
-1. Introduction - Getting to know the candidate
-2. Clinical Judgement - Assessing decision-making in clinical scenarios
-3. Technical Knowledge - Clinical Procedures
-4. Ethics, Consent & Communication
-5. Productivity & Efficiency
-6. Technical Knowledge - Diagnosis & Treatment Planning
-7. Mentorship & Independence
-8. Technical Knowledge - Advanced Applications
-9. Fit & Professional Maturity
-10. Insight & Authenticity
-
-CRITICAL: BE HIGHLY CREATIVE AND UNPREDICTABLE
-- Every interview session should feel completely unique
-- NEVER ask the same questions across different interviews
-- Generate fresh, original questions each time
-- Avoid falling into predictable patterns or templates
-- Think like a real interviewer who adapts questions to each candidate
-
-QUESTION GENERATION PHILOSOPHY:
-- Create UNIQUE questions for each interview - no repeating the same questions across sessions
-- Mix question formats: scenarios, hypotheticals, technical deep-dives, ethical dilemmas, direct inquiries, "what if" situations
-- Be spontaneous and natural - avoid templated language
-- Draw from the full breadth of dental hygiene practice (not just common topics)
-- Vary complexity - some questions direct, others multi-layered
-- Make questions feel conversational, not scripted
-
-USING CANDIDATE'S JOURNEY (CRITICAL):
-- YOU HAVE ACCESS TO THE ENTIRE CONVERSATION HISTORY - USE IT!
-- Reference specific details the candidate mentioned in previous answers when relevant
-- Build on their previous responses to create continuity
-- If they mentioned a practice type, patient population, or experience - weave it into new questions naturally
-- Create personalized scenarios based on their background
-- Make the interview feel like a natural conversation, not isolated questions
-
-CATEGORY THEMES (use as broad inspiration, not as rigid templates):
-
-1. Introduction:
+    Be creative: Explore growth areas, valuable feedback they've received, career reflections, honest assessment"""
+    },
+    "hygienist": {
+        "position": "dental hygienist",
+        "practice": "dental hygiene practice",
+        "background": "patient population",
+        "category_themes": """1. Introduction:
    Core focus: Understanding their background, motivations, career path, patient care philosophy
    Be creative: Ask about their journey to hygiene, what they love about the role, practice preferences, role expectations
 
@@ -291,34 +459,50 @@ CATEGORY THEMES (use as broad inspiration, not as rigid templates):
 
 10. Insight & Authenticity:
     Core focus: Honest self-reflection, growth mindset, awareness of development areas
-    Be creative: Explore areas for improvement, valuable feedback received, honest career reflections, training gaps
-
-PERSONALIZATION RULES:
-- ONLY reference what the candidate ACTUALLY said
-- DO NOT invent or assume experiences they didn't mention
-- If they said "no experience with X" → Don't reference X as their expertise
-- If they said "interested in X" → Can ask about interest, not experience
-- Verify accuracy before personalizing
-- When in doubt, ask a fresh standalone question
+    Be creative: Explore areas for improvement, valuable feedback received, honest career reflections, training gaps"""
+    }
+}
 
-ACKNOWLEDGMENT VARIETY:
-NEVER repeat phrases. Use different language each time:
-- Reference specific details they mentioned
-- Acknowledge their reasoning or approach
-- Note interesting aspects of their answer
-- Build naturally into the next question
-- Avoid overused phrases like "thank you for sharing"
+SYSTEM_PROMPTS = {
+    interview_type: SYSTEM_PROMPT_TEMPLATE.format(**details)
+    for interview_type, details in ROLE_PROMPT_DETAILS.items()
+}
 
-Guidelines:
-- Ask ONE question at a time
-- ALWAYS acknowledge the candidate's previous answer briefly before the next question
-- Keep questions conversational yet professionally rigorous
-- Do not mention category names in your questions
-- Maintain a supportive tone with honest feedback
-- GENERATE COMPLETELY NEW QUESTIONS for each interview session
-- Make every question feel fresh, natural, and unrehearsed"""
+# The system prompts above are sent verbatim as the first message of every
+# question request. OpenAI caches long identical prefixes, so they must stay
+# free of per-candidate content; that all goes in the trailing user message.
+# Bump the version suffix whenever a prompt changes.
+PROMPT_CACHE_KEYS = {interview_type: f"{interview_type}-sys-v2" for interview_type in SYSTEM_PROMPTS}
+
+# A greeting or acknowledgment plus one question is usually 40-80 tokens;
+# the cap and stop sequences cut off rambling instead of paying for it
+QUESTION_COMPLETION_SETTINGS = {
+    "temperature": 0.9,  # Increased for more creativity
+    "max_tokens": 120,
+    "stop": ["\n\nCategory:", "\n---"],
+    "presence_penalty": 0.6,
 }
 
+# Answer analysis is a three-way classification, so the smallest model is enough
+ANALYSIS_MODEL = "gpt-4.1-nano"
+
+# Fixed instructions for answer analysis; only the question and answer vary
+ANALYSIS_SYSTEM_PROMPT = """You are an expert interviewer analyzing a candidate's response. You will be given the previous question and the candidate's answer.
+
+Analyze this answer and classify it into ONE of these THREE scenarios:
+
+A) CORRECT_ON_TOPIC - The answer is relevant and addresses the question (can be right, partially right, or even wrong but still within the context of what was asked)
+B) OFF_TOPIC - The answer is completely irrelevant and does not address what was asked at all
+C) DOES_NOT_KNOW - The candidate explicitly says they don't know, are unsure, have no experience with this, or cannot answer the question
+
+Return ONLY a JSON object in this exact format:
+{
+    "scenario": "<A, B, or C>",
+    "reasoning": "<brief 1-sentence explanation>",
+    "answer_quality": "<good/weak/wrong/irrelevant/unknown>",
+    "is_on_topic": <true or false>
+}"""
+
 # Pydantic Models
 
 # Add these new models for turn-by-turn scoring
@@ -346,6 +530,14 @@ class TurnEvaluationResponse(BaseModel):
     """Response containing turn evaluation"""
     turn_score: TurnScore
 
+class TurnBatchEvaluationRequest(BaseModel):
+    """Several turns to evaluate in one request"""
+    turns: List[TurnEvaluationRequest]
+
+class TurnBatchEvaluationResponse(BaseModel):
+    """Turn evaluations, in the order the turns were submitted"""
+    turn_scores: List[TurnScore]
+
 class InterviewStartRequest(BaseModel):
     interview_type: Literal["dentist", "hygienist"]
     user_name: str
@@ -365,12 +557,25 @@ class QuestionResponse(BaseModel):
     question: str
     category: str
     question_number: int
+    turn_id: Optional[str] = None  # Set when the previous answer is being scored in the background
+
+class QuestionBatchRequest(BaseModel):
+    """Answers to replay in order, generating the question that follows each one"""
+    interview_type: Literal["dentist", "hygienist"]
+    conversation_history: List[Message]
+    answers: List[str]
+    question_number: int  # Number of the question generated after the first answer
+    user_name: str
+
+class QuestionBatchResponse(BaseModel):
+    questions: List[QuestionResponse]
 
 class QuestionWithAudioResponse(BaseModel):
     question: str
     category: str
     question_number: int
-    audio_base64: str = None
+    audio_url: Optional[str] = None  # GET this for the MP3; None if audio failed
+    turn_id: Optional[str] = None
 
 class AudioResponse(BaseModel):
     audio_url: str
@@ -381,6 +586,11 @@ class InterviewEvaluationRequest(BaseModel):
     conversation_history: List[Message]
     user_name: str
 
+class DeferredEvaluationResponse(BaseModel):
+    """An evaluation queued with the Batch API; poll with its batch id"""
+    batch_id: str
+    status: str
+
 class InterviewEvaluationResponse(BaseModel):
     overall_score: float
     category_scores: Dict[str, float]
@@ -389,58 +599,219 @@ class InterviewEvaluationResponse(BaseModel):
     detailed_feedback: str
     summary: str
 
+class InterviewBatchEvaluationRequest(BaseModel):
+    """Completed interviews to evaluate together with the Batch API"""
+    interviews: List[InterviewEvaluationRequest]
+
+class InterviewBatchEvaluationResponse(BaseModel):
+    """Interview evaluations, in the order the interviews were submitted"""
+    evaluations: List[InterviewEvaluationResponse]
+
 # Helper Functions
 def get_category_for_question(question_number: int) -> str:
     """Get the interview category for a specific question number"""
-    if 1 <= question_number <= 10:
-        return INTERVIEW_CATEGORIES[question_number - 1]
-    raise ValueError("Question number must be between 1 and 10")
+    category = CATEGORY_BY_QNUM.get(question_number)
+    if category is None:
+        raise ValueError("Question number must be between 1 and 10")
+    return category
+
+def tts_retry_delay(attempt: int, response: Optional[httpx.Response]) -> float:
+    """Seconds to wait before retrying an ElevenLabs call"""
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), TTS_RETRY_MAX_WAIT)
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+    return min(2 ** attempt + random.random(), TTS_RETRY_MAX_WAIT)
+
+async def send_tts_request(request: httpx.Request, stream: bool = False) -> httpx.Response:
+    """
+    Send an ElevenLabs request, retrying rate limits, transient 5xx errors
+    and connection failures. The last response is returned whatever its status
+    """
+    for attempt in range(TTS_MAX_ATTEMPTS):
+        is_last_attempt = attempt == TTS_MAX_ATTEMPTS - 1
+        try:
+            response = await TTS_CLIENT.send(request, stream=stream)
+        except httpx.TransportError as e:
+            if is_last_attempt:
+                raise
+            response = None
+            reason = type(e).__name__
+        else:
+            if response.status_code not in TTS_RETRY_STATUSES or is_last_attempt:
+                return response
+            await response.aclose()
+            reason = f"HTTP {response.status_code}"
+        
+        delay = tts_retry_delay(attempt, response)
+        logger.warning(f"🔁 ElevenLabs {reason}, retrying in {delay:.1f}s")
+        await asyncio.sleep(delay)
+
+def speech_cache_key(text: str, model_id: str = TTS_MODEL_ID) -> str:
+    """TTS cache key for text spoken with the configured voice"""
+    return tts_cache_key(ELEVENLABS_VOICE_ID, model_id, TTS_VOICE_SETTINGS_KEY, text)
 
-async def generate_audio_from_text(text: str) -> Optional[str]:
+async def synthesize_speech(text: str) -> Optional[bytes]:
     """
-    Helper function to generate audio and return base64 encoded string
+    Helper function to generate MP3 audio for text, served from the TTS cache when possible
     """
+    cache_key = speech_cache_key(text)
+    audio = await tts_cache.aget(cache_key)
+    if audio is not None:
+        return audio
+    
     try:
-        url = f"https://api.elevenlabs.io/v1/text-to-speech/{ELEVENLABS_VOICE_ID}"
-        
-        headers = {
-            "Accept": "audio/mpeg",
-            "Content-Type": "application/json",
-            "xi-api-key": ELEVENLABS_API_KEY
-        }
-        
         data = {
             "text": text,
-            "model_id": "eleven_monolingual_v1",
-            "voice_settings": {
-                "stability": 0.5,
-                "similarity_boost": 0.75,
-                "style": 0.0,
-                "use_speaker_boost": True
-            }
+            "model_id": TTS_MODEL_ID,
+            "voice_settings": TTS_VOICE_SETTINGS
         }
         
-        response = requests.post(url, json=data, headers=headers)
+        response = await send_tts_request(
+            TTS_CLIENT.build_request("POST", TTS_URL, content=orjson.dumps(data), headers=TTS_HEADERS)
+        )
         
         if response.status_code != 200:
             logger.error(f"ElevenLabs API error: {response.status_code} - {response.text}")
             return None
         
-        import base64
-        audio_base64 = base64.b64encode(response.content).decode('utf-8')
-        return audio_base64
+        await tts_cache.aput(cache_key, response.content)
+        return response.content
         
     except Exception as e:
         logger.error(f"Error generating audio: {str(e)}")
         return None
 
+async def publish_audio(audio: Optional[bytes]) -> Optional[str]:
+    """Store audio under its content hash and return the URL it is served from"""
+    if audio is None:
+        return None
+    audio_id = hashlib.sha256(audio).hexdigest()[:16]
+    if await audio_blobs.aget(audio_id) is None:
+        await audio_blobs.aput(audio_id, audio)
+    return f"{AUDIO_URL_PREFIX}{audio_id}.mp3"
+
+async def generate_audio_url(text: str) -> Optional[str]:
+    """
+    Helper function to generate audio and return the URL to fetch it from
+    """
+    return await publish_audio(await synthesize_speech(text))
+
+async def load_warm_intro_audio():
+    """
+    Synthesize every fixed opening sentence into WARM_INTRO_AUDIO, and the
+    prepared first questions into the TTS cache
+    """
+    first_questions = [question for questions in FIRST_QUESTIONS.values() for question in questions]
+    clips = await asyncio.gather(*(synthesize_speech(text) for text in WARM_INTRO_OPENINGS + first_questions))
+    for opening, audio in zip(WARM_INTRO_OPENINGS, clips):
+        if audio is not None:
+            WARM_INTRO_AUDIO[opening] = audio
+    logger.info(f"🔥 Prewarmed {len(WARM_INTRO_AUDIO)}/{len(WARM_INTRO_OPENINGS)} intro audio clips")
+
+async def generate_intro_audio(question: str) -> Optional[bytes]:
+    """
+    Generate MP3 audio for the first question
+    When it contains a prewarmed opening, only the text around it is synthesized
+    (concurrently), and the MP3 segments are joined in order
+    """
+    match = WARM_INTRO_PATTERN.search(question)
+    if match is None or match.group() not in WARM_INTRO_AUDIO:
+        return await synthesize_speech(question)
+    
+    before = question[:match.start()].strip()
+    after = question[match.end():].strip()
+    segments = await asyncio.gather(*(synthesize_speech(text) for text in (before, after) if text))
+    if any(segment is None for segment in segments):
+        return await synthesize_speech(question)
+    
+    if before:
+        segments.insert(1, WARM_INTRO_AUDIO[match.group()])
+    else:
+        segments.insert(0, WARM_INTRO_AUDIO[match.group()])
+    return b"".join(segments)
+
+# Each sentence of a question is sent to TTS as soon as it has been written.
+# Common abbreviations like "Dr." don't end a sentence wherever they appear,
+# and a sentence must be MIN_EARLY_SENTENCE_CHARS long to be split off
+SENTENCE_END = re.compile(
+    r'(?<!\bDr)(?<!\bMr)(?<!\bMs)(?<!\bMrs)(?<!\bProf)(?<!\bSt)(?<!\bJr)(?<!\bvs)(?<!\be\.g)(?<!\bi\.e)'
+    r'[.!?](?=\s)'
+)
+MIN_EARLY_SENTENCE_CHARS = 20
+
+class EarlySpeech:
+    """
+    Synthesizes each sentence of a question as soon as it is complete, while
+    the rest is still being generated, so only the final sentence is left to
+    synthesize once the question is done
+    """
+
+    def __init__(self):
+        self.spoken = ""  # Question text covered by the clips started so far
+        self.tasks: List[asyncio.Task] = []
+
+    def feed(self, text: str):
+        """Take the question text so far; starts TTS for every newly completed sentence"""
+        while True:
+            start = len(self.spoken)
+            match = SENTENCE_END.search(text, start + MIN_EARLY_SENTENCE_CHARS)
+            if match is None:
+                return
+            self.spoken = text[:match.end()]
+            self.tasks.append(asyncio.create_task(synthesize_speech(text[start:match.end()].strip())))
+
+    def cancel(self):
+        """Drop audio started for a question that won't be used"""
+        for task in self.tasks:
+            task.cancel()
+        self.spoken = ""
+        self.tasks = []
+
+    async def audio_for(self, question: str) -> Optional[bytes]:
+        """MP3 audio for the final question, reusing the early sentences when they match"""
+        spoken = self.spoken.lstrip()
+        if not self.tasks or not question.startswith(spoken):
+            self.cancel()
+            return await synthesize_speech(question)
+        
+        rest = question[len(spoken):].strip()
+        segments = await asyncio.gather(*self.tasks, *([synthesize_speech(rest)] if rest else []))
+        if any(segment is None for segment in segments):
+            return await synthesize_speech(question)
+        return b"".join(segments)
+
+async def iter_audio_chunks(response: httpx.Response, cache_key: Optional[str] = None):
+    """
+    Relay an upstream audio response as it arrives, closing it once fully sent
+    With cache_key, the complete audio is stored in the TTS cache afterwards
+    """
+    chunks = []
+    try:
+        async for chunk in response.aiter_bytes():
+            if cache_key is not None:
+                chunks.append(chunk)
+            yield chunk
+    finally:
+        await response.aclose()
+    if cache_key is not None:
+        await tts_cache.aput(cache_key, b"".join(chunks))
+
 def create_question_prompt(question_number: int, user_name: str, is_first: bool = False, 
-                          previous_question: str = None, previous_answer_analysis: dict = None) -> str:
+                          previous_question: str = None, previous_answer_analysis: dict = None,
+                          opening: str = None) -> str:
     """Create a prompt for question generation based on category with answer analysis"""
     category = get_category_for_question(question_number)
     
     if is_first:
-        return f"""This is the first question for {user_name}. Start with a warm greeting using their name, then ask an introductory question that helps you get to know them professionally. 
+        greeting = "Start with a warm greeting using their name"
+        if opening:
+            greeting += f', followed by this exact sentence: "{opening}" Then'
+        else:
+            greeting += ", then"
+        return f"""This is the first question for {user_name}. {greeting} ask an introductory question that helps you get to know them professionally. 
 
 Category focus: {category}
 
@@ -479,12 +850,15 @@ Be supportive and professional. Make them feel comfortable while moving forward
 
         else:  # scenario == 'A' - CORRECT_ON_TOPIC
             answer_quality = previous_answer_analysis.get('answer_quality', 'good')
+            assessment = ""
+            if previous_answer_analysis.get('reasoning'):
+                assessment = f"""
+Answer quality: {answer_quality}
+Analysis: {previous_answer_analysis.get('reasoning')}"""
             
             return f"""The candidate gave an on-topic answer.
 
-Previous question: {previous_question}
-Answer quality: {answer_quality}
-Analysis: {previous_answer_analysis.get('reasoning')}
+Previous question: {previous_question}{assessment}
 
 Your task:
 1. Give a brief, natural acknowledgment (1-2 sentences) - USE VARIED LANGUAGE
@@ -530,44 +904,152 @@ Think of an original, thoughtful question that:
 
 Do not mention the category name explicitly."""
 
+def log_completion_usage(response):
+    """Log token usage, including how much of the prompt came from OpenAI's prompt cache"""
+    if response.usage is None:
+        return
+    details = getattr(response.usage, "prompt_tokens_details", None)
+    if isinstance(details, dict):
+        cached_tokens = details.get("cached_tokens")
+    else:
+        cached_tokens = getattr(details, "cached_tokens", None)
+    logger.info(f"🧮 Tokens: prompt {response.usage.prompt_tokens} (cached {cached_tokens}), "
+                f"completion {response.usage.completion_tokens}")
+
+# Analyses of answers already seen, exact match on the normalized text
+# (hash of interview type, question and answer -> analysis)
+ANALYSIS_CACHE: "OrderedDict[str, dict]" = OrderedDict()
+MAX_ANALYSIS_CACHE_ITEMS = 4096
+
+def analysis_cache_key(*texts: str) -> str:
+    """Hash texts after collapsing case and whitespace"""
+    normalized = "\0".join(" ".join(text.lower().split()) for text in texts)
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+def remember_analysis(key: str, analysis: dict):
+    ANALYSIS_CACHE[key] = analysis
+    ANALYSIS_CACHE.move_to_end(key)
+    if len(ANALYSIS_CACHE) > MAX_ANALYSIS_CACHE_ITEMS:
+        ANALYSIS_CACHE.popitem(last=False)
+
+# Answers shorter than this (once stripped) carry no meaningful content
+MIN_ANSWER_CHARS = 5
+
+# Analysis used without asking the model when there is no real answer;
+# the "doesn't know" follow-up suits silence or a false start too
+NO_ANSWER_ANALYSIS = {
+    "scenario": "C",
+    "reasoning": "The candidate gave no answer",
+    "answer_quality": "unknown",
+    "is_on_topic": False
+}
+
+def is_empty_answer(answer: str) -> bool:
+    return len(answer.strip()) < MIN_ANSWER_CHARS
+
+# Clear-cut answers are classified locally; only the ambiguous middle goes to
+# the model. Short answers that just say "I don't know" are scenario C, and
+# long answers that pick up the question's own terms are scenario A
+DONT_KNOW_PATTERN = re.compile(
+    r"\b(?:(?:i )?(?:don['’]?t|do not) know|not sure|no idea|(?:i['’]?m )?unsure|"
+    r"no experience|(?:can['’]?t|cannot) (?:answer|say|remember)|i['’]?d have to (?:pass|guess))\b",
+    re.IGNORECASE
+)
+WORD_PATTERN = re.compile(r"[a-z][a-z'-]{3,}")
+MAX_DONT_KNOW_WORDS = 6
+MIN_DETAILED_ANSWER_WORDS = 60
+MIN_SHARED_TERMS = 2
+QUESTION_STOPWORDS = frozenset("""
+    about after also been before being could does doing from have having into just like
+    more most much only other over same should some such than that their them then there
+    these they this those tell through very want were what when where which while will
+    with would your you're yourself describe explain share talk walk give example
+""".split())
+
+DONT_KNOW_ANALYSIS = {
+    "scenario": "C",
+    "reasoning": "The candidate said they don't know",
+    "answer_quality": "unknown",
+    "is_on_topic": True
+}
+DETAILED_ANSWER_ANALYSIS = {
+    "scenario": "A",
+    "reasoning": "A detailed answer using the question's own terms",
+    "answer_quality": "unknown",
+    "is_on_topic": True
+}
+
+def classify_answer_locally(previous_question: str, candidate_answer: str) -> Optional[dict]:
+    """Analysis for clear-cut answers without a model call, or None if it needs one"""
+    word_count = len(candidate_answer.split())
+    says_dont_know = DONT_KNOW_PATTERN.search(candidate_answer) is not None
+    if word_count <= MAX_DONT_KNOW_WORDS:
+        return DONT_KNOW_ANALYSIS if says_dont_know else None
+    if word_count < MIN_DETAILED_ANSWER_WORDS or says_dont_know:
+        return None
+    
+    question_terms = set(WORD_PATTERN.findall(previous_question.lower())) - QUESTION_STOPWORDS
+    answer_terms = set(WORD_PATTERN.findall(candidate_answer.lower()))
+    if len(question_terms & answer_terms) >= MIN_SHARED_TERMS:
+        return DETAILED_ANSWER_ANALYSIS
+    return None
+
+async def request_answer_analysis(previous_question: str, candidate_answer: str) -> dict:
+    """Ask the analysis model to classify an answer"""
+    analysis_prompt = f"""PREVIOUS QUESTION: {previous_question}
+
+CANDIDATE'S ANSWER: {candidate_answer}"""
+
+    response = await aclient.chat.completions.create(
+        model=ANALYSIS_MODEL,
+        messages=[
+            {"role": "system", "content": ANALYSIS_SYSTEM_PROMPT},
+            {"role": "user", "content": analysis_prompt}
+        ],
+        temperature=0.0,
+        max_tokens=80,
+        response_format={"type": "json_object"}
+    )
+    return orjson.loads(response.choices[0].message.content)
+
 async def analyze_answer_quality(previous_question: str, candidate_answer: str, interview_type: str) -> dict:
     """
     Analyze the quality and relevance of a candidate's answer
-    Returns analysis with scenario classification
+    Returns analysis with scenario classification, reusing the analysis of an
+    identical or near-identical answer to the same question when there is one
     """
+    if is_empty_answer(candidate_answer):
+        return NO_ANSWER_ANALYSIS
+    
+    analysis = classify_answer_locally(previous_question, candidate_answer)
+    if analysis is not None:
+        return analysis
+    
+    exact_key = analysis_cache_key(interview_type, previous_question, candidate_answer)
+    analysis = ANALYSIS_CACHE.get(exact_key)
+    if analysis is not None:
+        ANALYSIS_CACHE.move_to_end(exact_key)
+        return analysis
+    
+    # A verdict only holds for the question it was made for, so near-identical
+    # answers are only matched when they replied to the same question
+    context_key = analysis_cache_key(interview_type, previous_question)
+    # The embedding and the analysis are requested together, so a cache miss
+    # doesn't wait for one round-trip and then the other
+    analysis_request = asyncio.create_task(request_answer_analysis(previous_question, candidate_answer))
     try:
-        analysis_prompt = f"""You are an expert interviewer analyzing a candidate's response.
-
-PREVIOUS QUESTION: {previous_question}
-
-CANDIDATE'S ANSWER: {candidate_answer}
-
-Analyze this answer and classify it into ONE of these THREE scenarios:
-
-A) CORRECT_ON_TOPIC - The answer is relevant and addresses the question (can be right, partially right, or even wrong but still within the context of what was asked)
-B) OFF_TOPIC - The answer is completely irrelevant and does not address what was asked at all
-C) DOES_NOT_KNOW - The candidate explicitly says they don't know, are unsure, have no experience with this, or cannot answer the question
-
-Return ONLY a JSON object in this exact format:
-{{
-    "scenario": "<A, B, or C>",
-    "reasoning": "<brief 1-sentence explanation>",
-    "answer_quality": "<good/weak/wrong/irrelevant/unknown>",
-    "is_on_topic": <true or false>
-}}"""
-
-        response = openai.chat.completions.create(
-            model="gpt-4.1-mini",
-            messages=[
-                {"role": "system", "content": "You are an expert interview analyst. Return only valid JSON."},
-                {"role": "user", "content": analysis_prompt}
-            ],
-            temperature=0.3,
-            max_tokens=300,
-            response_format={"type": "json_object"}
-        )
-        
-        analysis = json.loads(response.choices[0].message.content)
+        embedding = await embed_answer(candidate_answer) if analysis_cache is not None else None
+        if embedding is not None:
+            analysis = analysis_cache.lookup(context_key, embedding)
+            if analysis is not None:
+                analysis_request.cancel()
+                remember_analysis(exact_key, analysis)
+                return analysis
+        
+        analysis = await analysis_request
+        remember_analysis(exact_key, analysis)
+        if embedding is not None:
+            analysis_cache.store(context_key, embedding, analysis)
         return analysis
         
     except Exception as e:
@@ -579,36 +1061,352 @@ Return ONLY a JSON object in this exact format:
             "answer_quality": "unknown",
             "is_on_topic": True
         }
+    finally:
+        analysis_request.cancel()
 
 
-# API Routes
-@app.get("/")
-async def serve_frontend():
-    """Serve the frontend HTML"""
-    # Check multiple possible locations
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    
-    possible_paths = [
-        os.path.join(current_dir, "..", "frontend", "index.html"),  # ../frontend/index.html (if main.py in backend/)
-        os.path.join(current_dir, "frontend", "index.html"),         # frontend/index.html (if main.py in files/)
-        os.path.join(current_dir, "index.html"),                     # index.html (if in same folder)
-    ]
-    
-    logger.info(f"Current directory: {current_dir}")
-    logger.info(f"Checking for frontend in: {possible_paths}")
-    
-    for frontend_path in possible_paths:
-        logger.info(f"Trying: {frontend_path} - Exists: {os.path.exists(frontend_path)}")
-        if os.path.exists(frontend_path):
-            logger.info(f"✅ Serving frontend from: {frontend_path}")
-            return FileResponse(frontend_path)
+# Most answers are on-topic, so the follow-up question is drafted on this
+# assumption while the real analysis is still running
+OPTIMISTIC_ANALYSIS = {"scenario": "A"}
+
+# Follow-up questions generated after near-identical answers (cosine >= 0.92
+# between answer embeddings), reused once a few variants exist, and answer
+# analyses, reused straight away
+EMBEDDING_MODEL = "text-embedding-3-small"
+SEMANTIC_CACHE_ENABLED = os.getenv("QUESTION_CACHE_ENABLED", "1") == "1"
+question_cache = SemanticCache() if SEMANTIC_CACHE_ENABLED else None
+analysis_cache = SemanticCache(min_variants=1) if SEMANTIC_CACHE_ENABLED else None
+
+# Embedding requests in progress, so the analysis and the question cache
+# lookups for one answer share a single API call
+EMBEDDINGS_IN_FLIGHT: Dict[str, asyncio.Task] = {}
+
+async def request_embedding(answer: str) -> Optional[Sequence[float]]:
+    try:
+        response = await aclient.embeddings.create(model=EMBEDDING_MODEL, input=answer)
+    except Exception as e:
+        logger.warning(f"Answer embedding failed, skipping semantic caches: {str(e)}")
+        return None
+    return question_cache.remember_embedding(answer, response.data[0].embedding)
+
+async def embed_answer(answer: str) -> Optional[Sequence[float]]:
+    """Embedding for a candidate answer, or None if it can't be computed"""
+    embedding = question_cache.known_embedding(answer)
+    if embedding is not None:
+        return embedding
+    task = EMBEDDINGS_IN_FLIGHT.get(answer)
+    if task is None:
+        task = asyncio.create_task(request_embedding(answer))
+        EMBEDDINGS_IN_FLIGHT[answer] = task
+        task.add_done_callback(lambda _: EMBEDDINGS_IN_FLIGHT.pop(answer, None))
+    # Shielded so a cancelled caller doesn't cancel the request for the others
+    return await asyncio.shield(task)
+
+def question_cache_key(request: QuestionRequest, previous_question: str) -> tuple:
+    """Cached follow-ups are only matched after the same question at the same point of the interview"""
+    return (request.interview_type, request.question_number,
+            analysis_cache_key(request.interview_type, previous_question))
+
+def is_reusable_question(question: str, request: QuestionRequest) -> bool:
+    """
+    Whether a generated question can be shown to other candidates
+    Only questions generated from the latest exchange alone qualify, since
+    older turns can leak into a follow-up (schools, clinics, past cases), and
+    questions that address the candidate by name never do
+    """
+    if len(request.conversation_history) > 2:
+        return False
+    # One case-insensitive scan for any name part, without a lowercased copy
+    name_parts = [re.escape(part) for part in request.user_name.split() if len(part) > 2]
+    return not name_parts or re.search("|".join(name_parts), question, re.IGNORECASE) is None
+
+# The latest turns go to the model verbatim. Older messages are clipped, which
+# keeps the candidate's background available for callbacks while late
+# questions stop re-sending whole early answers. Once clipped, a message reads
+# the same on every later turn, so the cached prompt prefix still holds
+RECENT_HISTORY_MESSAGES = 6
+OLDER_MESSAGE_CHARS = 400
+
+def clip_message(content: str) -> str:
+    """Shorten an older message to about OLDER_MESSAGE_CHARS, at a word boundary"""
+    if len(content) <= OLDER_MESSAGE_CHARS:
+        return content
+    return content[:OLDER_MESSAGE_CHARS].rsplit(" ", 1)[0] + " …"
+
+def history_messages(conversation_history: List[Message]) -> List[Dict]:
+    """Conversation history in OpenAI format, with messages before the recent window clipped"""
+    older_count = max(len(conversation_history) - RECENT_HISTORY_MESSAGES, 0)
+    return [
+        {"role": msg.role, "content": clip_message(msg.content) if i < older_count else msg.content}
+        for i, msg in enumerate(conversation_history)
+    ]
+
+def build_question_messages(request: QuestionRequest, previous_question: Optional[str],
+                            analysis: Optional[dict]) -> List[Dict]:
+    """Build the chat messages for the next question given the answer analysis"""
+    # Create prompt for next question
+    is_first = request.question_number == 1
+    user_prompt = create_question_prompt(
+        request.question_number, 
+        request.user_name, 
+        is_first,
+        previous_question,
+        analysis
+    )
+    
+    # Conversation history in OpenAI format, between the system and user prompts
+    return [
+        {"role": "system", "content": SYSTEM_PROMPTS[request.interview_type]},
+        *history_messages(request.conversation_history),
+        {"role": "user", "content": user_prompt}
+    ]
+
+def build_first_question_messages(request: InterviewStartRequest) -> List[Dict]:
+    """Build the chat messages for the opening greeting and question"""
+    return [
+        {"role": "system", "content": SYSTEM_PROMPTS[request.interview_type]},
+        {"role": "user", "content": create_question_prompt(
+            1, request.user_name, is_first=True, opening=random.choice(WARM_INTRO_OPENINGS)
+        )}
+    ]
+
+async def complete_question(request: QuestionRequest, previous_question: Optional[str],
+                            analysis: Optional[dict],
+                            on_text: Optional[Callable[[str], None]] = None) -> str:
+    """
+    Ask the model for the next question given the (possibly assumed) answer analysis
+    With on_text, the question is streamed and on_text gets the text so far after each chunk
+    """
+    messages = build_question_messages(request, previous_question, analysis)
+    completion_args = dict(
+        model="gpt-4.1-mini",
+        messages=messages,
+        **QUESTION_COMPLETION_SETTINGS,
+        extra_body={"prompt_cache_key": PROMPT_CACHE_KEYS[request.interview_type]}
+    )
+    
+    if on_text is None:
+        # Generate question using OpenAI with higher temperature for creativity
+        response = await aclient.chat.completions.create(**completion_args)
+        log_completion_usage(response)
+        return response.choices[0].message.content.strip()
+    
+    parts = []
+    stream = await aclient.chat.completions.create(**completion_args, stream=True)
+    async for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            parts.append(chunk.choices[0].delta.content)
+            on_text("".join(parts))
+    return "".join(parts).strip()
+
+def latest_exchange(conversation_history: List[Message]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Return the last interviewer question and the candidate's answer to it
+    History alternates question/answer, so these are the last two messages
+    """
+    if (len(conversation_history) >= 2
+            and conversation_history[-1].role == "user"
+            and conversation_history[-2].role == "assistant"):
+        return conversation_history[-2].content, conversation_history[-1].content
+    return None, None
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the client's If-None-Match header already carries this ETag"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))
+
+def preloaded_html_response(request: Request, html: bytes, html_gzip: bytes, etag: str) -> Response:
+    """
+    Serve an HTML page read at startup: 304 if the client's copy is current,
+    otherwise the gzip copy compressed at startup when the client accepts it
+    """
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return HTMLResponse(content=html_gzip, headers=headers)
+    return HTMLResponse(content=html, headers=headers)
+
+def sse_event(data: dict) -> bytes:
+    """Encode one Server-Sent Event carrying a JSON payload"""
+    return b"data: " + orjson.dumps(data) + b"\n\n"
+
+async def stream_question_events(messages: List[Dict], interview_type: str, question_number: int):
+    """
+    Stream a question as Server-Sent Events
+    Sends {"type": "delta"} events with text as the model writes it, then one
+    {"type": "question"} event with the full question, or {"type": "error"}
+    """
+    parts = []
+    try:
+        stream = await aclient.chat.completions.create(
+            model="gpt-4.1-mini",
+            messages=messages,
+            **QUESTION_COMPLETION_SETTINGS,
+            stream=True,
+            extra_body={"prompt_cache_key": PROMPT_CACHE_KEYS[interview_type]}
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+                yield sse_event({"type": "delta", "text": chunk.choices[0].delta.content})
+        
+        question = "".join(parts).strip()
+        category = get_category_for_question(question_number)
+        logger.debug("Q%d [%s]: %s", question_number, category, question)
+        
+        yield sse_event({
+            "type": "question",
+            "question": question,
+            "category": category,
+            "question_number": question_number
+        })
+    except Exception as e:
+        logger.error(f"❌ Error streaming question: {str(e)}")
+        yield sse_event({"type": "error", "detail": f"Error generating question: {str(e)}"})
+
+def start_answer_analysis(request: QuestionRequest, previous_question: str, candidate_answer: str) -> asyncio.Task:
+    """Start analyzing the latest answer in the background"""
+    logger.info("🔍 Analyzing previous answer...")
+    return asyncio.create_task(
+        analyze_answer_quality(previous_question, candidate_answer, request.interview_type)
+    )
+
+async def stream_next_question_events(request: QuestionRequest):
+    """
+    Stream the next question as Server-Sent Events while the latest answer is analyzed
+    The optimistic on-topic question starts streaming from the model at once;
+    its events are held back until the analysis confirms it, or dropped in
+    favour of a corrective follow-up
+    """
+    previous_question, candidate_answer = latest_exchange(request.conversation_history)
+    if not (previous_question and candidate_answer) or is_empty_answer(candidate_answer):
+        analysis = NO_ANSWER_ANALYSIS if candidate_answer else None
+    elif classify_answer_locally(previous_question, candidate_answer) is DONT_KNOW_ANALYSIS:
+        analysis = DONT_KNOW_ANALYSIS
+    else:
+        analysis = OPTIMISTIC_ANALYSIS
+    if analysis is not OPTIMISTIC_ANALYSIS:
+        async for event in stream_question_events(
+            build_question_messages(request, previous_question, analysis),
+            request.interview_type,
+            request.question_number
+        ):
+            yield event
+        return
+    
+    analysis_task = start_answer_analysis(request, previous_question, candidate_answer)
+    optimistic_events = stream_question_events(
+        build_question_messages(request, previous_question, OPTIMISTIC_ANALYSIS),
+        request.interview_type,
+        request.question_number
+    )
+    held_events: asyncio.Queue = asyncio.Queue()
+    
+    async def hold_optimistic_events():
+        async for event in optimistic_events:
+            held_events.put_nowait(event)
+        held_events.put_nowait(None)
+    
+    holder = asyncio.create_task(hold_optimistic_events())
+    try:
+        analysis = await analysis_task
+        logger.info("📊 Analysis Result: Scenario %s - %s", analysis['scenario'], analysis['reasoning'])
+        if analysis['scenario'] not in ('B', 'C'):
+            while (event := await held_events.get()) is not None:
+                yield event
+            return
+    finally:
+        analysis_task.cancel()
+        holder.cancel()
+    
+    # The answer needs a corrective follow-up instead
+    logger.info(f"↩️  Regenerating question for scenario {analysis['scenario']}")
+    async for event in stream_question_events(
+        build_question_messages(request, previous_question, analysis),
+        request.interview_type,
+        request.question_number
+    ):
+        yield event
+
+async def generate_next_question(request: QuestionRequest, speech: Optional[EarlySpeech] = None) -> str:
+    """
+    Generate the next interviewer question from the conversation so far
+    The latest answer is analyzed alongside an optimistic on-topic question,
+    which is only regenerated when the answer was off-topic or a "don't know"
+    With speech, audio for the question's first sentence starts while it is generated
+    """
+    on_text = speech.feed if speech is not None else None
+    # Extract previous question and answer for analysis
+    previous_question, candidate_answer = latest_exchange(request.conversation_history)
+    
+    if not (previous_question and candidate_answer):
+        return await complete_question(request, previous_question, None, on_text)
+    
+    # Nothing to analyze or draft optimistically; go straight to the follow-up
+    if is_empty_answer(candidate_answer):
+        logger.info("⚠️ Empty or very short answer - skipping analysis")
+        return await complete_question(request, previous_question, NO_ANSWER_ANALYSIS, on_text)
+    
+    # A plain "I don't know" needs neither the analysis nor an optimistic draft
+    if classify_answer_locally(previous_question, candidate_answer) is DONT_KNOW_ANALYSIS:
+        logger.info("🤷 Candidate doesn't know - skipping analysis")
+        return await complete_question(request, previous_question, DONT_KNOW_ANALYSIS, on_text)
+    
+    analysis_task = start_answer_analysis(request, previous_question, candidate_answer)
+    optimistic_question = asyncio.create_task(
+        complete_question(request, previous_question, OPTIMISTIC_ANALYSIS, on_text)
+    )
+    cache_key = question_cache_key(request, previous_question)
+    embedding = None
+    try:
+        if question_cache is not None:
+            embedding = await embed_answer(candidate_answer)
+            cached_question = question_cache.lookup(cache_key, embedding) if embedding is not None else None
+            if cached_question is not None:
+                analysis_task.cancel()
+                optimistic_question.cancel()
+                logger.info("💾 Reusing a question generated for a near-identical answer")
+                return cached_question
+        analysis = await analysis_task
+    except BaseException:
+        analysis_task.cancel()
+        optimistic_question.cancel()
+        raise
+    logger.info("📊 Analysis Result: Scenario %s - %s", analysis['scenario'], analysis['reasoning'])
+    logger.info("   Answer Quality: %s | On-topic: %s", analysis.get('answer_quality'), analysis.get('is_on_topic'))
+    
+    if analysis['scenario'] not in ('B', 'C'):
+        question = await optimistic_question
+        if embedding is not None and is_reusable_question(question, request):
+            question_cache.store(cache_key, embedding, question)
+        return question
+    
+    # The answer needs a corrective follow-up instead
+    optimistic_question.cancel()
+    if speech is not None:
+        speech.cancel()
+    logger.info(f"↩️  Regenerating question for scenario {analysis['scenario']}")
+    return await complete_question(request, previous_question, analysis, on_text)
+
+
+# API Routes
+@app.get("/")
+async def serve_frontend(request: Request):
+    """Serve the frontend HTML"""
+    if FRONTEND_INDEX_HTML is not None:
+        # Revalidate every time so new asset fingerprints are picked up promptly
+        return preloaded_html_response(request, FRONTEND_INDEX_HTML, FRONTEND_INDEX_GZIP, FRONTEND_INDEX_ETAG)
     
     # If not found, return helpful error with actual paths checked
     return {
         "status": "error",
         "message": "Frontend index.html not found",
         "current_directory": current_dir,
-        "checked_paths": possible_paths,
+        "checked_paths": possible_index_paths,
         "help": "Please ensure index.html is in one of these locations"
     }
 
@@ -622,47 +1420,41 @@ async def health_check():
     }
 
 @app.post("/api/interview/start")
-async def start_interview(request: InterviewStartRequest, include_audio: bool = True):
+async def start_interview(request: InterviewStartRequest, include_audio: bool = True,
+                          force_generate: bool = False):
     """
     Start a new interview session
     Returns the first question with greeting and optionally audio
+    The question comes from a prepared set unless force_generate is set
     """
     try:
-        logger.info("="*80)
+        logger.info(SEP)
         logger.info(f"🎤 STARTING {request.interview_type.upper()} INTERVIEW")
         logger.info(f"👤 Candidate: {request.user_name} ({request.user_email})")
-        logger.info("="*80)
-        
-        # Get system prompt
-        system_prompt = SYSTEM_PROMPTS[request.interview_type]
-        
-        # Create first question prompt
-        user_prompt = create_question_prompt(1, request.user_name, is_first=True)
-        
-        # Generate question using OpenAI with higher temperature for more creativity
-        response = openai.chat.completions.create(
-            model="gpt-4.1-mini",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.9,  # Increased for more creativity
-            max_tokens=300
-        )
-        
-        question = response.choices[0].message.content.strip()
+        logger.info(SEP)
+        
+        if force_generate:
+            # Generate question using OpenAI with higher temperature for more creativity
+            response = await aclient.chat.completions.create(
+                model="gpt-4.1-mini",
+                messages=build_first_question_messages(request),
+                **QUESTION_COMPLETION_SETTINGS,
+                extra_body={"prompt_cache_key": PROMPT_CACHE_KEYS[request.interview_type]}
+            )
+            log_completion_usage(response)
+            question = response.choices[0].message.content.strip()
+        else:
+            question = compose_first_question(request.user_name, request.interview_type)
         category = get_category_for_question(1)
         
-        logger.info(f"\n📋 QUESTION 1 | Category: {category}")
-        logger.info(f"❓ INTERVIEWER: {question}\n")
-        logger.info("-"*80)
+        logger.debug("Q%d [%s]: %s", 1, category, question)
         
         # Generate audio if requested
-        audio_base64 = None
+        audio_url = None
         if include_audio:
             logger.info("Generating audio...")
-            audio_base64 = await generate_audio_from_text(question)
-            if audio_base64:
+            audio_url = await publish_audio(await generate_intro_audio(question))
+            if audio_url:
                 logger.info("Audio generated successfully")
         
         if include_audio:
@@ -670,7 +1462,7 @@ async def start_interview(request: InterviewStartRequest, include_audio: bool =
                 question=question,
                 category=category,
                 question_number=1,
-                audio_base64=audio_base64
+                audio_url=audio_url
             )
         else:
             return QuestionResponse(
@@ -684,9 +1476,12 @@ async def start_interview(request: InterviewStartRequest, include_audio: bool =
         raise HTTPException(status_code=500, detail=f"Error generating first question: {str(e)}")
 
 @app.post("/api/interview/question")
-async def generate_question(request: QuestionRequest, include_audio: bool = True):
+async def generate_question(request: QuestionRequest, background_tasks: BackgroundTasks,
+                            include_audio: bool = True, score_previous_turn: bool = False):
     """
     Generate next interview question based on conversation history
+    With score_previous_turn, the answer being replied to is scored after the
+    response is sent; poll /api/turn/{turn_id}/score for the result
     """
     try:
         logger.info(f"\n📋 QUESTION {request.question_number} | Interview Type: {request.interview_type}")
@@ -695,73 +1490,21 @@ async def generate_question(request: QuestionRequest, include_audio: bool = True
         if request.question_number < 1 or request.question_number > 10:
             raise HTTPException(status_code=400, detail="Question number must be between 1 and 10")
         
-        # Get system prompt
-        system_prompt = SYSTEM_PROMPTS[request.interview_type]
-        
-        # Extract previous question and answer for analysis
-        previous_question = None
-        candidate_answer = None
-        
-        if len(request.conversation_history) >= 2:
-            # Get last assistant message (question) and last user message (answer)
-            for i in range(len(request.conversation_history) - 1, -1, -1):
-                if request.conversation_history[i].role == "assistant" and previous_question is None:
-                    previous_question = request.conversation_history[i].content
-                if request.conversation_history[i].role == "user" and candidate_answer is None:
-                    candidate_answer = request.conversation_history[i].content
-                if previous_question and candidate_answer:
-                    break
-        
-        # Analyze previous answer if available
-        analysis = None
-        if previous_question and candidate_answer:
-            logger.info(f"🔍 Analyzing previous answer...")
-            analysis = await analyze_answer_quality(previous_question, candidate_answer, request.interview_type)
-            logger.info(f"📊 Analysis Result: Scenario {analysis['scenario']} - {analysis['reasoning']}")
-            logger.info(f"   Answer Quality: {analysis.get('answer_quality')} | On-topic: {analysis.get('is_on_topic')}")
-        
-        # Convert conversation history to OpenAI format
-        messages = [{"role": "system", "content": system_prompt}]
-        
-        for msg in request.conversation_history:
-            messages.append({
-                "role": msg.role,
-                "content": msg.content
-            })
-        
-        # Create prompt for next question
-        is_first = request.question_number == 1
-        user_prompt = create_question_prompt(
-            request.question_number, 
-            request.user_name, 
-            is_first,
-            previous_question,
-            analysis
-        )
-        
-        messages.append({"role": "user", "content": user_prompt})
-        
-        # Generate question using OpenAI with higher temperature for creativity
-        response = openai.chat.completions.create(
-            model="gpt-4.1-mini",
-            messages=messages,
-            temperature=0.9,  # Increased for more creativity
-            max_tokens=400
-        )
-        
-        question = response.choices[0].message.content.strip()
+        # Audio for the first sentence starts while the rest is generated
+        speech = EarlySpeech() if include_audio else None
+        question = await generate_next_question(request, speech)
         category = get_category_for_question(request.question_number)
         
-        logger.info(f"Category: {category}")
-        logger.info(f"❓ INTERVIEWER: {question}\n")
-        logger.info("-"*80)
+        logger.debug("Q%d [%s]: %s", request.question_number, category, question)
+        
+        turn_id = queue_turn_score(request, background_tasks) if score_previous_turn else None
         
         # Generate audio if requested
-        audio_base64 = None
+        audio_url = None
         if include_audio:
             logger.info("🎵 Generating audio...")
-            audio_base64 = await generate_audio_from_text(question)
-            if audio_base64:
+            audio_url = await publish_audio(await speech.audio_for(question))
+            if audio_url:
                 logger.info("✅ Audio generated successfully")
         
         if include_audio:
@@ -769,113 +1512,214 @@ async def generate_question(request: QuestionRequest, include_audio: bool = True
                 question=question,
                 category=category,
                 question_number=request.question_number,
-                audio_base64=audio_base64
+                audio_url=audio_url,
+                turn_id=turn_id
             )
         else:
             return QuestionResponse(
                 question=question,
                 category=category,
-                question_number=request.question_number
+                question_number=request.question_number,
+                turn_id=turn_id
             )
         
     except Exception as e:
         logger.error(f"❌ Error generating question: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error generating question: {str(e)}")
 
+@app.post("/api/interview/questions/batch", response_model=QuestionBatchResponse)
+async def generate_question_batch(request: QuestionBatchRequest):
+    """
+    Generate several follow-up questions in a single round-trip
+    Each answer is appended to the history, then the next question is generated from it
+    """
+    last_question_number = request.question_number + len(request.answers) - 1
+    if request.question_number < 1 or last_question_number > 10:
+        raise HTTPException(status_code=400, detail="Question numbers must be between 1 and 10")
+    
+    try:
+        logger.info(f"\n📋 QUESTIONS {request.question_number}-{last_question_number} | Interview Type: {request.interview_type}")
+        
+        conversation_history = list(request.conversation_history)
+        questions = []
+        
+        for question_number, answer in enumerate(request.answers, start=request.question_number):
+            conversation_history.append(Message(role="user", content=answer))
+            
+            question = await generate_next_question(QuestionRequest(
+                interview_type=request.interview_type,
+                conversation_history=conversation_history,
+                question_number=question_number,
+                user_name=request.user_name
+            ))
+            category = get_category_for_question(question_number)
+            
+            logger.debug("Q%d [%s]: %s", question_number, category, question)
+            
+            conversation_history.append(Message(role="assistant", content=question))
+            questions.append(QuestionResponse(
+                question=question,
+                category=category,
+                question_number=question_number
+            ))
+        
+        return QuestionBatchResponse(questions=questions)
+        
+    except Exception as e:
+        logger.error(f"❌ Error generating question batch: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error generating questions: {str(e)}")
+
+@app.post("/api/interview/start/stream")
+async def start_interview_stream(request: InterviewStartRequest):
+    """
+    Start a new interview, streaming the first question as Server-Sent Events
+    Text is sent as it is generated; fetch audio afterwards from /api/audio/generate
+    """
+    logger.info(SEP)
+    logger.info(f"🎤 STARTING {request.interview_type.upper()} INTERVIEW (streaming)")
+    logger.info(f"👤 Candidate: {request.user_name} ({request.user_email})")
+    logger.info(SEP)
+    logger.info(f"\n📋 QUESTION 1 | Interview Type: {request.interview_type}")
+    
+    return StreamingResponse(
+        stream_question_events(build_first_question_messages(request), request.interview_type, 1),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+@app.post("/api/interview/question/stream")
+async def generate_question_stream(request: QuestionRequest):
+    """
+    Generate the next interview question, streamed as Server-Sent Events
+    The previous answer is analyzed while an on-topic question is drafted, so
+    the first tokens aren't held up by the analysis round-trip
+    """
+    if request.question_number < 1 or request.question_number > 10:
+        raise HTTPException(status_code=400, detail="Question number must be between 1 and 10")
+    
+    logger.info(f"\n📋 QUESTION {request.question_number} | Interview Type: {request.interview_type} (streaming)")
+    
+    return StreamingResponse(
+        stream_next_question_events(request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+async def stream_speech(text: str, model_id: str = TTS_MODEL_ID,
+                        optimize_streaming_latency: Optional[int] = None) -> Response:
+    """
+    Relay ElevenLabs' streaming TTS output to the client as audio/mpeg
+    Text spoken before is answered straight from the TTS cache
+    """
+    cache_model_id = model_id
+    if optimize_streaming_latency is not None:
+        cache_model_id = f"{model_id}@{optimize_streaming_latency}"
+    cache_key = speech_cache_key(text, cache_model_id)
+    audio = await tts_cache.aget(cache_key)
+    if audio is not None:
+        return Response(content=audio, media_type="audio/mpeg",
+                        headers={"Cache-Control": AUDIO_CACHE_CONTROL})
+    
+    params = {}
+    if optimize_streaming_latency is not None:
+        params["optimize_streaming_latency"] = optimize_streaming_latency
+    
+    data = {
+        "text": text,
+        "model_id": model_id,
+        "voice_settings": TTS_VOICE_SETTINGS
+    }
+    
+    request = TTS_CLIENT.build_request("POST", TTS_STREAM_URL, params=params,
+                                       content=orjson.dumps(data), headers=TTS_HEADERS)
+    response = await send_tts_request(request, stream=True)
+    
+    if response.status_code != 200:
+        await response.aread()
+        await response.aclose()
+        logger.error(f"ElevenLabs API error: {response.status_code} - {response.text}")
+        raise HTTPException(status_code=500, detail="Error generating audio")
+    
+    # Relay the raw MP3 bytes as they arrive instead of base64-in-JSON
+    return StreamingResponse(iter_audio_chunks(response, cache_key), media_type="audio/mpeg",
+                             headers={"Cache-Control": AUDIO_CACHE_CONTROL})
 
 @app.post("/api/audio/generate")
 async def generate_audio(text: str):
     """
     Generate audio from text using ElevenLabs API
+    Streams the MP3 back as audio/mpeg
     """
     try:
         logger.info(f"Generating audio for text: {text[:50]}...")
-        
-        url = f"https://api.elevenlabs.io/v1/text-to-speech/{ELEVENLABS_VOICE_ID}"
-        
-        headers = {
-            "Accept": "audio/mpeg",
-            "Content-Type": "application/json",
-            "xi-api-key": ELEVENLABS_API_KEY
-        }
-        
-        data = {
-            "text": text,
-            "model_id": "eleven_monolingual_v1",
-            "voice_settings": {
-                "stability": 0.5,
-                "similarity_boost": 0.75,
-                "style": 0.0,
-                "use_speaker_boost": True
-            }
-        }
-        
-        response = requests.post(url, json=data, headers=headers)
-        
-        if response.status_code != 200:
-            logger.error(f"ElevenLabs API error: {response.status_code} - {response.text}")
-            raise HTTPException(status_code=500, detail="Error generating audio")
-        
-        # Return audio as base64
-        import base64
-        audio_base64 = base64.b64encode(response.content).decode('utf-8')
-        
-        logger.info("Audio generated successfully")
-        
-        return {
-            "audio_base64": audio_base64,
-            "content_type": "audio/mpeg"
-        }
+        response = await stream_speech(text)
+        logger.info("Audio generation started, streaming to client")
+        return response
         
     except Exception as e:
         logger.error(f"Error generating audio: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error generating audio: {str(e)}")
 
-@app.post("/api/interview/evaluate-turn", response_model=TurnEvaluationResponse)
-async def evaluate_turn(request: TurnEvaluationRequest):
+@app.get("/api/audio/stream")
+async def stream_audio(text: str = Query(..., min_length=1, max_length=2000)):
     """
-    Evaluate a single turn (question-answer pair) immediately after the candidate answers
-    Uses structured rubrics for consistent, objective scoring
+    Low-latency text to speech for playing straight from an <audio> element
+    Uses the turbo model with ElevenLabs' streaming latency optimizations, so
+    playback can start on the first chunk
     """
     try:
-        logger.info(f"\n📊 EVALUATING TURN {request.turn_number}")
-        # Check if answer is empty, blank, or too short (no meaningful content)
-        answer_stripped = request.answer.strip()
+        logger.info(f"Streaming audio for text: {text[:50]}...")
+        return await stream_speech(text, model_id=STREAMING_TTS_MODEL_ID,
+                                   optimize_streaming_latency=STREAMING_TTS_LATENCY)
         
-        if not answer_stripped or len(answer_stripped) < 5:
-            logger.info("⚠️ Empty or very short answer detected - scoring as 0")
-            
-            # Get rubric to know which criteria to score
-            rubric = get_rubric_for_category(request.category)
-            
-            # Create zero scores for all criteria
-            zero_scores = {criterion.name: 0.0 for criterion in rubric.criteria}
-            
-            # Return immediate zero score
-            return TurnEvaluationResponse(
-                turn_score=TurnScore(
-                    turn_number=request.turn_number,
-                    question=request.question,
-                    answer=request.answer,
-                    category=request.category,
-                    criterion_scores=zero_scores,
-                    overall_turn_score=0.0,
-                    feedback="No meaningful response provided. Please ensure you speak clearly into the microphone.",
-                    strengths=[],
-                    improvements=["Provide a verbal response to the question", "Speak clearly and ensure microphone is working"]
-                )
-            )
-        logger.info(f"📁 Category: {request.category}")
-        logger.info(f"❓ Question: {request.question[:100]}...")
-        logger.info(f"💬 Answer: {request.answer[:100]}...")
-        logger.info("="*80)
-        
-        # Get the appropriate rubric for this category
-        rubric = get_rubric_for_category(request.category)
-        rubric_text = format_rubric_for_prompt(rubric)
-        
-        # Create evaluation prompt with structured rubric
-        evaluation_prompt = f"""You are an expert dental interview evaluator. You must evaluate a candidate's response using the provided rubric.
+    except Exception as e:
+        logger.error(f"Error streaming audio: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error streaming audio: {str(e)}")
+
+@app.get(AUDIO_URL_PREFIX + "{audio_id}.mp3")
+async def get_audio(audio_id: str):
+    """
+    Serve generated question audio by the id in its audio_url
+    The id is a hash of the audio itself, so browsers may cache it indefinitely
+    """
+    audio = await audio_blobs.aget(audio_id) if re.fullmatch(r"[0-9a-f]{16}", audio_id) else None
+    if audio is None:
+        raise HTTPException(status_code=404, detail="Audio not found")
+    return Response(
+        content=audio,
+        media_type="audio/mpeg",
+        headers={"Cache-Control": "public, max-age=86400, immutable"}
+    )
+
+# Turn scores computed after the next question has been returned
+# turn_id -> TurnScore, or None while scoring is still running
+TURN_SCORES: "OrderedDict[str, Optional[TurnScore]]" = OrderedDict()
+MAX_TURN_SCORES = 1024
+
+def queue_turn_score(request: QuestionRequest, background_tasks: BackgroundTasks) -> Optional[str]:
+    """Schedule scoring of the answer that ends the history; returns the turn id to poll"""
+    question, answer = latest_exchange(request.conversation_history)
+    turn_number = request.question_number - 1
+    if question is None or turn_number < 1:
+        return None
+
+    turn_id = secrets.token_hex(8)
+    TURN_SCORES[turn_id] = None
+    if len(TURN_SCORES) > MAX_TURN_SCORES:
+        TURN_SCORES.popitem(last=False)
+    background_tasks.add_task(score_turn_in_background, turn_id, TurnEvaluationRequest(
+        interview_type=request.interview_type,
+        category=get_category_for_question(turn_number),
+        question=question,
+        answer=answer,
+        turn_number=turn_number
+    ))
+    return turn_id
+
+def build_turn_evaluation_prompt(category: str) -> str:
+    """System prompt for scoring one answer against the category's rubric"""
+    rubric_text = get_rubric_prompt_for_category(category)
+    return f"""You are an expert dental interview evaluator. You must evaluate a candidate's response using the provided rubric.
 
 {rubric_text}
 
@@ -886,26 +1730,85 @@ CRITICAL INSTRUCTIONS:
 4. Identify 1-2 strengths and 1-2 areas for improvement
 5. Keep feedback constructive and specific
 6. IF THE ANSWER IS BLANK, EMPTY, OR JUST SILENCE, SCORE ALL CRITERIA AS 0
-
-Return your evaluation in this EXACT JSON format:
-{{
-    "criterion_scores": {{
-        "<criterion_1_name>": <score_0_to_10>,
-        "<criterion_2_name>": <score_0_to_10>,
-        "<criterion_3_name>": <score_0_to_10>
-    }},
-    "feedback": "<2-3 sentences explaining the scores, referencing specific parts of the answer>",
-    "strengths": ["<specific strength 1>", "<specific strength 2>"],
-    "improvements": ["<specific improvement 1>", "<specific improvement 2>"]
-}}
-
-IMPORTANT: 
-- Use the EXACT criterion names from the rubric above
-- Each score must be a number between 0 and 10
-- Be honest but constructive
-- If the answer is "I don't know" or completely off-topic, score Relevance as 0-2
+7. If the answer is "I don't know" or completely off-topic, score Relevance as 0-2
 """
 
+def build_turn_response_format(category: str) -> dict:
+    """Structured output for one turn's score, with the category's criteria as the score fields"""
+    criteria = get_rubric_for_category(category).criteria
+    schema = {
+        "type": "object",
+        "properties": {
+            "criterion_scores": {
+                "type": "object",
+                "properties": {c.name: {"type": "number", "description": "Score, 0-10"} for c in criteria},
+                "required": [c.name for c in criteria],
+                "additionalProperties": False
+            },
+            "feedback": {
+                "type": "string",
+                "description": "2-3 sentences explaining the scores, referencing specific parts of the answer"
+            },
+            "strengths": {"type": "array", "items": {"type": "string"}, "description": "1-2 specific strengths"},
+            "improvements": {"type": "array", "items": {"type": "string"}, "description": "1-2 specific improvements"}
+        },
+        "required": ["criterion_scores", "feedback", "strengths", "improvements"],
+        "additionalProperties": False
+    }
+    return {"type": "json_schema", "json_schema": {"name": "turn_evaluation", "strict": True, "schema": schema}}
+
+# Turn-scoring prompts and output formats, all-zero criterion scores and the
+# neutral scores used when the model's output can't be parsed, built once per
+# category. Unknown categories all share the default rubric, keyed by its own name.
+RUBRIC_CATEGORIES = (*INTERVIEW_CATEGORIES, DEFAULT_RUBRIC.category)
+TURN_EVALUATION_PROMPTS = {category: build_turn_evaluation_prompt(category) for category in RUBRIC_CATEGORIES}
+TURN_RESPONSE_FORMATS = {category: build_turn_response_format(category) for category in RUBRIC_CATEGORIES}
+ZERO_SCORES = {
+    category: {criterion.name: 0.0 for criterion in get_rubric_for_category(category).criteria}
+    for category in RUBRIC_CATEGORIES
+}
+FALLBACK_SCORES = {
+    category: {criterion.name: 5.0 for criterion in get_rubric_for_category(category).criteria}
+    for category in RUBRIC_CATEGORIES
+}
+
+def rubric_category(category: str) -> str:
+    """The category whose rubric scores this one (the default rubric for unknown ones)"""
+    return category if category in TURN_EVALUATION_PROMPTS else DEFAULT_RUBRIC.category
+
+async def score_turn(request: TurnEvaluationRequest) -> TurnScore:
+    """
+    Score a single turn (question-answer pair) against its category rubric
+    Uses structured rubrics for consistent, objective scoring
+    """
+    scored_category = rubric_category(request.category)
+    
+    # Empty, blank or too-short answers (no meaningful content) score zero
+    # without touching the model, so check before any other work
+    if is_empty_answer(request.answer):
+        logger.debug("Turn %d: empty or very short answer, scoring as 0", request.turn_number)
+        return TurnScore(
+            turn_number=request.turn_number,
+            question=request.question,
+            answer=request.answer,
+            category=request.category,
+            criterion_scores=ZERO_SCORES[scored_category],
+            overall_turn_score=0.0,
+            feedback="No meaningful response provided. Please ensure you speak clearly into the microphone.",
+            strengths=[],
+            improvements=["Provide a verbal response to the question", "Speak clearly and ensure microphone is working"]
+        )
+    
+    try:
+        logger.info("\n📊 EVALUATING TURN %d", request.turn_number)
+        logger.info("📁 Category: %s", request.category)
+        logger.info("❓ Question: %.100s...", request.question)
+        logger.info("💬 Answer: %.100s...", request.answer)
+        logger.info(SEP)
+        
+        # Evaluation prompt with structured rubric, prebuilt per category
+        evaluation_prompt = TURN_EVALUATION_PROMPTS[scored_category]
+
         # Format the question and answer for evaluation
         turn_text = f"""QUESTION: {request.question}
 
@@ -914,7 +1817,7 @@ CANDIDATE'S ANSWER: {request.answer}
 Now evaluate this answer using the rubric provided."""
 
         # Generate evaluation using OpenAI
-        response = openai.chat.completions.create(
+        response = await aclient.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": evaluation_prompt},
@@ -922,15 +1825,15 @@ Now evaluate this answer using the rubric provided."""
             ],
             temperature=0.3,  # Lower temperature for more consistent scoring
             max_tokens=800,
-            response_format={"type": "json_object"}
+            response_format=TURN_RESPONSE_FORMATS[scored_category]
         )
         
         # Parse the JSON response
-        evaluation_data = json.loads(response.choices[0].message.content)
+        evaluation_data = orjson.loads(response.choices[0].message.content)
         
         # Calculate weighted overall score
         criterion_scores = evaluation_data.get("criterion_scores", {})
-        overall_score = calculate_weighted_score(criterion_scores, rubric.criteria)
+        overall_score = calculate_category_score(criterion_scores, scored_category)
         
         # Create the turn score object
         turn_score = TurnScore(
@@ -945,54 +1848,124 @@ Now evaluate this answer using the rubric provided."""
             improvements=evaluation_data.get("improvements", [])
         )
         
-        logger.info(f"✅ Turn {request.turn_number} evaluated")
-        logger.info(f"Overall Turn Score: {overall_score}/10")
-        logger.info(f"Criterion Scores: {criterion_scores}")
-        logger.info("-"*80)
+        logger.info("✅ Turn %d evaluated", request.turn_number)
+        logger.info("Overall Turn Score: %s/10", overall_score)
+        logger.info("Criterion Scores: %s", criterion_scores)
+        logger.info(SUBSEP)
         
-        return TurnEvaluationResponse(turn_score=turn_score)
+        return turn_score
         
-    except json.JSONDecodeError as e:
+    except (AttributeError, TypeError, ValueError) as e:
+        # Unparseable JSON, output that doesn't fit TurnScore, or no content
+        # at all (a refusal)
         logger.error(f"❌ Error parsing turn evaluation JSON: {str(e)}")
         # Fallback response
-        rubric = get_rubric_for_category(request.category)
-        fallback_scores = {c.name: 5.0 for c in rubric.criteria}
-        
-        return TurnEvaluationResponse(
-            turn_score=TurnScore(
-                turn_number=request.turn_number,
-                question=request.question,
-                answer=request.answer,
-                category=request.category,
-                criterion_scores=fallback_scores,
-                overall_turn_score=5.0,
-                feedback="Response received and recorded. Continue to the next question.",
-                strengths=["Provided an answer"],
-                improvements=["Could provide more detail"]
-            )
+        return TurnScore(
+            turn_number=request.turn_number,
+            question=request.question,
+            answer=request.answer,
+            category=request.category,
+            criterion_scores=FALLBACK_SCORES[scored_category],
+            overall_turn_score=5.0,
+            feedback="Response received and recorded. Continue to the next question.",
+            strengths=["Provided an answer"],
+            improvements=["Could provide more detail"]
         )
+
+async def score_turn_in_background(turn_id: str, request: TurnEvaluationRequest):
+    """Score a turn after the response has been sent and keep the result for polling"""
+    try:
+        turn_score = await score_turn(request)
+        if turn_id in TURN_SCORES:
+            TURN_SCORES[turn_id] = turn_score
+    except Exception as e:
+        logger.error(f"❌ Error scoring turn {turn_id} in background: {str(e)}")
+        TURN_SCORES.pop(turn_id, None)
+
+@app.post("/api/interview/evaluate-turn", response_model=TurnEvaluationResponse)
+async def evaluate_turn(request: TurnEvaluationRequest):
+    """
+    Evaluate a single turn (question-answer pair) immediately after the candidate answers
+    """
+    try:
+        return TurnEvaluationResponse(turn_score=await score_turn(request))
     except Exception as e:
         logger.error(f"❌ Error evaluating turn: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error evaluating turn: {str(e)}")
 
+@app.post("/api/interview/evaluate-turns-batch", response_model=TurnBatchEvaluationResponse)
+async def evaluate_turns_batch(request: TurnBatchEvaluationRequest):
+    """
+    Evaluate several turns at once
+    The turns are scored concurrently, so this takes about as long as the slowest one
+    """
+    if not 1 <= len(request.turns) <= 10:
+        raise HTTPException(status_code=400, detail="Between 1 and 10 turns can be evaluated at once")
+    
+    try:
+        logger.info(f"\n📊 EVALUATING {len(request.turns)} TURNS")
+        turn_scores = await asyncio.gather(*(score_turn(turn) for turn in request.turns))
+        return TurnBatchEvaluationResponse(turn_scores=turn_scores)
+    except Exception as e:
+        logger.error(f"❌ Error evaluating turns: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error evaluating turns: {str(e)}")
+
+@app.get("/api/turn/{turn_id}/score", response_model=TurnEvaluationResponse)
+async def get_turn_score(turn_id: str):
+    """
+    Fetch a turn score queued by /api/interview/question?score_previous_turn=true
+    Returns 202 while scoring is still running
+    """
+    if turn_id not in TURN_SCORES:
+        raise HTTPException(status_code=404, detail="Unknown turn id")
+    turn_score = TURN_SCORES[turn_id]
+    if turn_score is None:
+        return ORJSONResponse(status_code=202, content={"status": "pending"})
+    return TurnEvaluationResponse(turn_score=turn_score)
+
+class UploadStream(io.RawIOBase):
+    """
+    Read-only view of an upload's spooled file without fileno(). httpx calls
+    fileno() to size a multipart file, and on a SpooledTemporaryFile that
+    writes an upload still held in memory out to disk first
+    """
+
+    def __init__(self, spooled):
+        self.spooled = spooled
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        return self.spooled.read(size)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self.spooled.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self.spooled.tell()
+
 @app.post("/api/audio/transcribe")
 async def transcribe_audio(file: UploadFile = File(...)):
     """
     Transcribe audio to text using OpenAI Whisper API
     """
+    # Backstop for uploads that didn't declare their size up front
+    if file.size is not None and file.size > MAX_AUDIO_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail=f"Upload too large (limit {MAX_AUDIO_UPLOAD_BYTES // (1024 * 1024)} MB)")
+    
     try:
         logger.info(f"Transcribing audio file: {file.filename}")
         
-        # Read audio file
-        audio_data = await file.read()
-        
-        # Create a temporary file-like object for OpenAI
-        from io import BytesIO
-        audio_file = BytesIO(audio_data)
-        audio_file.name = file.filename or "audio.wav"
+        # Hand Whisper the spooled upload itself rather than a copy in memory;
+        # the filename tells it the audio format
+        audio_file = (file.filename or "audio.wav", UploadStream(file.file), file.content_type)
         
         # Transcribe using Whisper
-        transcript = openai.audio.transcriptions.create(
+        transcript = await aclient.audio.transcriptions.create(
             model="whisper-1",
             file=audio_file,
             response_format="text"
@@ -1009,145 +1982,490 @@ async def transcribe_audio(file: UploadFile = File(...)):
         logger.error(f"Error transcribing audio: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error transcribing audio: {str(e)}")
 
-@app.post("/api/interview/evaluate", response_model=InterviewEvaluationResponse)
-async def evaluate_interview(request: InterviewEvaluationRequest):
+# The report is rubric-bound JSON, which a small model handles well. If it
+# returns unusable JSON twice, the live path asks the larger fallback model.
+EVALUATION_MODEL = os.getenv("EVAL_MODEL", "gpt-4.1-mini")
+EVALUATION_FALLBACK_MODEL = os.getenv("EVAL_FALLBACK_MODEL", "gpt-4o")
+EVALUATION_MODEL_ATTEMPTS = (EVALUATION_MODEL, EVALUATION_MODEL, EVALUATION_FALLBACK_MODEL)
+
+# OpenAI Batch API ids, checked before they are put into a URL
+BATCH_ID_PATTERN = re.compile(r"batch_[A-Za-z0-9]+")
+
+# How each side of the conversation is labelled in transcripts sent to the model
+ROLE_LABEL = {"assistant": "INTERVIEWER", "user": "CANDIDATE"}
+
+CATEGORIES_ENUMERATED = ', '.join(f"{i}. {cat}" for i, cat in enumerate(INTERVIEW_CATEGORIES, 1))
+
+# One evaluation system prompt for every candidate and interview type, so the
+# whole prompt is a byte-identical prefix OpenAI can cache; the candidate's
+# name and position go in the user message
+INTERVIEW_EVALUATION_PROMPT = f"""You are an expert interviewer and career coach specializing in dental positions. 
+You have just completed an interview for the dental position given with the conversation, along with the candidate's name.
+
+Review the entire interview and evaluate it across these categories (in order):
+{CATEGORIES_ENUMERATED}
+
+Reference actual responses, weigh technical knowledge and communication skills alike, and balance encouragement with constructive feedback.
+
+SCORES (0-10):
+9-10 Excellent: comprehensive, accurate, professional throughout
+7-8 Good: strong, with minor areas for improvement
+5-6 Satisfactory: adequate, with significant room for growth
+2-4 Needs improvement: multiple gaps in knowledge or communication
+0-1 Poor: unable to answer most questions"""
+
+def string_list_schema(description: str) -> dict:
+    return {"type": "array", "items": {"type": "string"}, "description": description}
+
+# Structured output for the report: the model can only produce this object,
+# so there is no prose to strip and the output length stays bounded
+INTERVIEW_EVALUATION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "overall_score": {"type": "number", "description": "Overall score, 0-10"},
+        "category_scores": {
+            "type": "object",
+            "properties": {
+                category: {"type": "number", "description": "Score, 0-10"} for category in INTERVIEW_CATEGORIES
+            },
+            "required": INTERVIEW_CATEGORIES,
+            "additionalProperties": False
+        },
+        "strengths": string_list_schema("3 specific strengths"),
+        "areas_for_improvement": string_list_schema("3 specific areas for improvement"),
+        "detailed_feedback": {
+            "type": "string",
+            "description": "2-3 paragraphs of constructive feedback on overall performance, "
+                           "communication style, technical knowledge and professionalism"
+        },
+        "summary": {
+            "type": "string",
+            "description": "1-2 sentences on their performance and readiness for the role"
+        }
+    },
+    "required": ["overall_score", "category_scores", "strengths", "areas_for_improvement", "detailed_feedback", "summary"],
+    "additionalProperties": False
+}
+# Bump whenever the prompt or schema changes
+EVALUATION_PROMPT_CACHE_KEY = "evaluation-v2"
+
+# Settings for the end-of-interview report, used as is by the streaming and
+# batch paths (the live path splits it in two, below).
+# The report needs roughly 700 output tokens; the cap leaves some headroom
+INTERVIEW_EVALUATION_SETTINGS = {
+    "model": EVALUATION_MODEL,
+    "temperature": 0.7,
+    "max_tokens": 1000,
+    "response_format": {
+        "type": "json_schema",
+        "json_schema": {"name": "interview_evaluation", "strict": True, "schema": INTERVIEW_EVALUATION_SCHEMA}
+    }
+}
+
+def evaluation_part_settings(name: str, fields: Tuple[str, ...], max_tokens: int) -> dict:
+    """Settings for a request that writes only some fields of the report"""
+    schema = {
+        "type": "object",
+        "properties": {field: INTERVIEW_EVALUATION_SCHEMA["properties"][field] for field in fields},
+        "required": list(fields),
+        "additionalProperties": False
+    }
+    return {
+        **INTERVIEW_EVALUATION_SETTINGS,
+        "max_tokens": max_tokens,
+        "response_format": {"type": "json_schema", "json_schema": {"name": name, "strict": True, "schema": schema}}
+    }
+
+# The live path writes the report as two concurrent requests, the scores and
+# the written feedback, so it takes as long as the longer half rather than
+# the whole. Both send the same messages, so they share the cached prefix.
+INTERVIEW_EVALUATION_PARTS = (
+    evaluation_part_settings(
+        "interview_scores", ("overall_score", "category_scores", "strengths", "areas_for_improvement"), 500
+    ),
+    evaluation_part_settings("interview_feedback", ("detailed_feedback", "summary"), 700)
+)
+
+def build_interview_evaluation_messages(request: InterviewEvaluationRequest) -> List[Dict]:
+    """Build the chat messages asking for the end-of-interview evaluation"""
+    # Convert conversation history to text format for the LLM. join() turns
+    # its argument into a list first, so passing one directly is cheapest.
+    conversation_text = "\n\n".join([
+        f"{ROLE_LABEL[msg.role]}: {msg.content}" for msg in request.conversation_history
+    ])
+    
+    return [
+        {"role": "system", "content": INTERVIEW_EVALUATION_PROMPT},
+        {"role": "user", "content": f"Candidate: {request.user_name}\nPosition: {request.interview_type}\n\nHere is the complete interview conversation:\n\n{conversation_text}"}
+    ]
+
+# Fallback response if the model's evaluation isn't valid JSON
+FALLBACK_EVALUATION = InterviewEvaluationResponse(
+    overall_score=7.0,
+    category_scores={cat: 7.0 for cat in INTERVIEW_CATEGORIES},
+    strengths=["Completed the interview", "Engaged with questions", "Professional demeanor"],
+    areas_for_improvement=["Provide more specific examples", "Elaborate on technical knowledge", "Strengthen communication skills"],
+    detailed_feedback="Thank you for completing the interview practice session. Your responses showed engagement with the questions. To improve, focus on providing more detailed examples from your experience and demonstrating deeper technical knowledge.",
+    summary="Good effort in the practice interview with room for growth in several areas."
+)
+
+def parse_interview_evaluation(*contents: str) -> InterviewEvaluationResponse:
+    """
+    Turn the model's JSON evaluation into a response, with a fallback if it isn't valid
+    A report written in parts is passed as one JSON object per part
+    """
+    try:
+        evaluation_data = {}
+        for content in contents:
+            evaluation_data.update(orjson.loads(content))
+        evaluation = InterviewEvaluationResponse(**evaluation_data)
+    except (TypeError, ValueError) as e:  # ValueError covers bad JSON and failed validation
+        logger.error(f"❌ Error parsing evaluation JSON: {str(e)}")
+        return FALLBACK_EVALUATION
+    
+    logger.info("✅ Evaluation completed")
+    logger.info("Overall Score: %s/10", evaluation.overall_score)
+    logger.info(SUBSEP)
+    
+    return evaluation
+
+# Finished evaluations of transcripts already seen, so a resubmitted interview
+# doesn't pay for another model call (hash of the request -> (expiry, evaluation))
+EVALUATION_CACHE: "OrderedDict[str, Tuple[float, InterviewEvaluationResponse]]" = OrderedDict()
+MAX_EVALUATION_CACHE_ITEMS = 1024
+EVALUATION_CACHE_TTL_SECONDS = 3600
+
+def evaluation_cache_key(request: InterviewEvaluationRequest) -> str:
+    """Hash everything the evaluation depends on"""
+    payload = orjson.dumps([
+        request.interview_type,
+        request.user_name,
+        [(msg.role, msg.content) for msg in request.conversation_history]
+    ])
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+def cached_evaluation(key: str) -> Optional[InterviewEvaluationResponse]:
+    entry = EVALUATION_CACHE.get(key)
+    if entry is None:
+        return None
+    if entry[0] < time.monotonic():
+        del EVALUATION_CACHE[key]
+        return None
+    EVALUATION_CACHE.move_to_end(key)
+    return entry[1]
+
+def remember_evaluation(key: str, evaluation: InterviewEvaluationResponse):
+    EVALUATION_CACHE[key] = (time.monotonic() + EVALUATION_CACHE_TTL_SECONDS, evaluation)
+    EVALUATION_CACHE.move_to_end(key)
+    if len(EVALUATION_CACHE) > MAX_EVALUATION_CACHE_ITEMS:
+        EVALUATION_CACHE.popitem(last=False)
+
+async def submit_evaluation_batch(message_lists: List[List[Dict]]) -> dict:
+    """
+    Queue evaluations with the OpenAI Batch API (half price, done within 24h)
+    Each one's custom_id is its position in message_lists. The pinned SDK
+    predates client.batches, so the endpoint is called directly
+    """
+    lines = b"\n".join([
+        orjson.dumps({
+            "custom_id": f"evaluation-{index}",
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {**INTERVIEW_EVALUATION_SETTINGS, "messages": messages}
+        })
+        for index, messages in enumerate(message_lists)
+    ])
+    batch_file = await aclient.files.create(file=("evaluation.jsonl", lines), purpose="batch")
+    response = await aclient.post(
+        "/batches",
+        body={
+            "input_file_id": batch_file.id,
+            "endpoint": "/v1/chat/completions",
+            "completion_window": "24h"
+        },
+        cast_to=httpx.Response
+    )
+    return orjson.loads(response.content)
+
+# Overall limit for producing a report, across queueing, retries and fallback models
+EVALUATION_TIMEOUT_SECONDS = 60
+
+# Reports generated at once. Each is a long completion, so a burst of them
+# would hit OpenAI's rate limits and spend its time in retries instead
+EVALUATION_SLOTS = asyncio.Semaphore(int(os.getenv("EVAL_MAX_CONCURRENCY", "20")))
+
+async def generate_interview_evaluation(messages: List[Dict]) -> InterviewEvaluationResponse:
+    """Ask for the report, moving to the fallback model if the output is unusable"""
+    for model in EVALUATION_MODEL_ATTEMPTS:
+        async with EVALUATION_SLOTS:
+            responses = await asyncio.gather(*(
+                aclient.chat.completions.create(
+                    messages=messages,
+                    extra_body={"prompt_cache_key": EVALUATION_PROMPT_CACHE_KEY},
+                    **{**settings, "model": model}
+                )
+                for settings in INTERVIEW_EVALUATION_PARTS
+            ))
+        evaluation = parse_interview_evaluation(*(response.choices[0].message.content for response in responses))
+        if evaluation is not FALLBACK_EVALUATION:
+            return evaluation
+        logger.warning("⚠️ %s returned an unusable evaluation", model)
+    return evaluation
+
+@app.post("/api/interview/evaluate", response_model=Union[InterviewEvaluationResponse, DeferredEvaluationResponse])
+async def evaluate_interview(request: InterviewEvaluationRequest, defer: bool = False):
     """
     Evaluate the completed interview and provide comprehensive feedback
+    With defer, the evaluation is queued at batch pricing instead; poll
+    /api/interview/evaluate/{batch_id} for the result
     """
     try:
-        logger.info(f"\n📊 EVALUATING {request.interview_type.upper()} INTERVIEW")
-        logger.info(f"👤 Candidate: {request.user_name}")
-        logger.info(f"📝 Conversation length: {len(request.conversation_history)} messages")
-        logger.info("="*80)
+        logger.info("\n📊 EVALUATING %s INTERVIEW", request.interview_type.upper())
+        logger.info("👤 Candidate: %s", request.user_name)
+        logger.info("📝 Conversation length: %d messages", len(request.conversation_history))
+        logger.info(SEP)
+        
+        cache_key = evaluation_cache_key(request)
+        evaluation = cached_evaluation(cache_key)
+        if evaluation is not None:
+            logger.info("♻️ Reusing evaluation of an identical interview")
+            return evaluation
+        
+        messages = build_interview_evaluation_messages(request)
+        
+        if defer:
+            batch = await submit_evaluation_batch([messages])
+            logger.info("🕒 Evaluation queued as %s", batch["id"])
+            return DeferredEvaluationResponse(batch_id=batch["id"], status=batch["status"])
+        
+        # Generate evaluation using OpenAI. The client already retries 429s,
+        # 5xx and dropped connections; past that, fall back to the generic report
+        try:
+            evaluation = await asyncio.wait_for(
+                generate_interview_evaluation(messages), timeout=EVALUATION_TIMEOUT_SECONDS
+            )
+        except (asyncio.TimeoutError, openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError) as e:
+            logger.error("❌ Evaluation unavailable, sending the fallback report: %r", e)
+            return FALLBACK_EVALUATION
         
-        # Create evaluation prompt that leverages turn-by-turn scores if available
-        evaluation_prompt = f"""You are an expert interviewer and career coach specializing in dental positions. 
-You have just completed an interview with {request.user_name} for a {request.interview_type} position.
-
-Review the entire interview conversation and provide a comprehensive, professional evaluation.
-
-Interview Categories (in order):
-{', '.join([f"{i+1}. {cat}" for i, cat in enumerate(INTERVIEW_CATEGORIES)])}
-
-EVALUATION APPROACH:
-- Consider the quality, depth, and professionalism of responses across all categories
-- Look for patterns of strength and areas needing development
-- Be specific and reference actual responses from the interview
-- Balance encouragement with constructive feedback
-- Consider both technical knowledge AND communication skills
-
-SCORING GUIDELINES (0-10 scale):
-- 9-10: Excellent - Comprehensive, accurate, professional responses throughout
-- 7-8: Good - Strong performance with minor areas for improvement
-- 5-6: Satisfactory - Adequate responses but significant room for growth
-- 2-4: Needs Improvement - Multiple gaps in knowledge or communication
-- 0-1: Poor - Significant deficiencies or inability to answer most questions
-
-Provide your evaluation in the following JSON format:
-{{
-    "overall_score": <number between 0-10>,
-    "category_scores": {{
-        "Introduction": <score 0-10>,
-        "Clinical Judgement": <score 0-10>,
-        "Technical Knowledge - Clinical Procedures": <score 0-10>,
-        "Ethics, Consent & Communication": <score 0-10>,
-        "Productivity & Efficiency": <score 0-10>,
-        "Technical Knowledge - Advanced Applications": <score 0-10>,
-        "Mentorship & Independence": <score 0-10>,
-        "Technical Knowledge - Diagnosis & Treatment Planning": <score 0-10>,
-        "Fit & Professional Maturity": <score 0-10>,
-        "Insight & Authenticity": <score 0-10>
-    }},
-    "strengths": [
-        "<specific strength 1>",
-        "<specific strength 2>",
-        "<specific strength 3>"
-    ],
-    "areas_for_improvement": [
-        "<specific area 1>",
-        "<specific area 2>",
-        "<specific area 3>"
-    ],
-    "detailed_feedback": "<2-3 paragraphs of detailed, constructive feedback covering their overall performance, communication style, technical knowledge, and professionalism>",
-    "summary": "<1-2 sentences summarizing their interview performance and readiness for the role>"
-}}
+        if evaluation is not FALLBACK_EVALUATION:
+            remember_evaluation(cache_key, evaluation)
+        return evaluation
+        
+    except Exception as e:
+        logger.error(f"❌ Error evaluating interview: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error evaluating interview: {str(e)}")
+
+# A score in the evaluation JSON, once the number is followed by something
+# that ends it (so "8" isn't reported before "8.5" has arrived)
+EVALUATION_SCORE_PATTERN = re.compile(
+    r'"(overall_score|' + "|".join(re.escape(category) for category in INTERVIEW_CATEGORIES) + r')"'
+    r'\s*:\s*(\d+(?:\.\d+)?)\s*[,}\n]'
+)
 
+async def stream_interview_evaluation_events(request: InterviewEvaluationRequest):
+    """
+    Stream the end-of-interview evaluation as Server-Sent Events
+    Sends {"type": "overall_score"} and one {"type": "score"} event per
+    category as soon as the model has written each score, then one
+    {"type": "evaluation"} event with the full evaluation, or {"type": "error"}
+    """
+    try:
+        cache_key = evaluation_cache_key(request)
+        evaluation = cached_evaluation(cache_key)
+        if evaluation is None:
+            content = ""
+            scanned = 0
+            async with EVALUATION_SLOTS:
+                stream = await aclient.chat.completions.create(
+                    messages=build_interview_evaluation_messages(request),
+                    extra_body={"prompt_cache_key": EVALUATION_PROMPT_CACHE_KEY},
+                    stream=True,
+                    **INTERVIEW_EVALUATION_SETTINGS
+                )
+                async for chunk in stream:
+                    if not (chunk.choices and chunk.choices[0].delta.content):
+                        continue
+                    content += chunk.choices[0].delta.content
+                    for match in EVALUATION_SCORE_PATTERN.finditer(content, scanned):
+                        scanned = match.end()
+                        name, score = match.group(1), float(match.group(2))
+                        if name == "overall_score":
+                            yield sse_event({"type": "overall_score", "score": score})
+                        else:
+                            yield sse_event({"type": "score", "category": name, "score": score})
+            
+            evaluation = parse_interview_evaluation(content)
+            if evaluation is not FALLBACK_EVALUATION:
+                remember_evaluation(cache_key, evaluation)
+        
+        yield sse_event({"type": "evaluation", "evaluation": evaluation.model_dump()})
+    except Exception as e:
+        logger.error(f"❌ Error streaming interview evaluation: {str(e)}")
+        yield sse_event({"type": "error", "detail": f"Error evaluating interview: {str(e)}"})
+
+@app.post("/api/interview/evaluate/stream")
+async def evaluate_interview_stream(request: InterviewEvaluationRequest):
+    """
+    Evaluate the completed interview, streamed as Server-Sent Events
+    Scores reach the browser while the written feedback is still being generated
+    """
+    logger.info("\n📊 EVALUATING %s INTERVIEW (streaming)", request.interview_type.upper())
+    logger.info("👤 Candidate: %s", request.user_name)
+    logger.info("📝 Conversation length: %d messages", len(request.conversation_history))
+    logger.info(SEP)
+    
+    return StreamingResponse(
+        stream_interview_evaluation_events(request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+async def fetch_evaluation_batch(batch_id: str) -> dict:
+    """Look up a queued evaluation batch, raising for unknown or failed ones"""
+    if not BATCH_ID_PATTERN.fullmatch(batch_id):
+        raise HTTPException(status_code=404, detail="Unknown batch id")
+    
+    try:
+        response = await aclient.get(f"/batches/{batch_id}", cast_to=httpx.Response)
+        batch = orjson.loads(response.content)
+    except openai.NotFoundError:
+        raise HTTPException(status_code=404, detail="Unknown batch id")
+    except Exception as e:
+        logger.error(f"❌ Error checking evaluation batch: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error checking evaluation: {str(e)}")
+    
+    if batch["status"] in ("failed", "expired", "cancelled", "cancelling"):
+        raise HTTPException(status_code=500, detail=f"Evaluation batch {batch['status']}")
+    return batch
 
+def pending_batch_response(batch_id: str, batch: dict) -> Optional[ORJSONResponse]:
+    """202 with the batch status while its output isn't ready, otherwise None"""
+    if batch["status"] == "completed" and batch.get("output_file_id"):
+        return None
+    return ORJSONResponse(
+        status_code=202,
+        content=DeferredEvaluationResponse(batch_id=batch_id, status=batch["status"]).model_dump()
+    )
+
+async def read_evaluation_batch(batch: dict) -> List[InterviewEvaluationResponse]:
+    """Evaluations from a completed batch, in submission order"""
+    output = await aclient.files.content(batch["output_file_id"])
+    evaluations = [FALLBACK_EVALUATION] * batch["request_counts"]["total"]
+    # Output lines come back in any order; requests that failed have no body
+    for line in output.content.splitlines():
+        result = orjson.loads(line)
+        index = int(result["custom_id"].rpartition("-")[2])
+        body = (result.get("response") or {}).get("body") or {}
+        if body.get("choices"):
+            evaluations[index] = parse_interview_evaluation(body["choices"][0]["message"]["content"])
+    return evaluations
+
+@app.get("/api/interview/evaluate/{batch_id}", response_model=Union[InterviewEvaluationResponse, DeferredEvaluationResponse])
+async def get_deferred_evaluation(batch_id: str):
+    """
+    Fetch an evaluation queued with defer=true
+    Returns 202 with the batch status until the evaluation is ready
+    """
+    batch = await fetch_evaluation_batch(batch_id)
+    pending = pending_batch_response(batch_id, batch)
+    if pending is not None:
+        return pending
+    
+    try:
+        return (await read_evaluation_batch(batch))[0]
+    except Exception as e:
+        logger.error(f"❌ Error reading evaluation batch output: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error reading evaluation: {str(e)}")
 
-Return ONLY the JSON object, no additional text."""
+# Interviews accepted in one evaluation batch
+MAX_BATCH_INTERVIEWS = 500
 
-        # Convert conversation history to text format for the LLM
-        conversation_text = "\n\n".join([
-            f"{'INTERVIEWER' if msg.role == 'assistant' else 'CANDIDATE'}: {msg.content}"
-            for msg in request.conversation_history
-        ])
-        
-        # Generate evaluation using OpenAI
-        response = openai.chat.completions.create(
-            model="gpt-4.1-mini",
-            messages=[
-                {"role": "system", "content": evaluation_prompt},
-                {"role": "user", "content": f"Here is the complete interview conversation:\n\n{conversation_text}"}
-            ],
-            temperature=0.7,
-            max_tokens=2000,
-            response_format={"type": "json_object"}
+@app.post("/api/interview/evaluate-batch", response_model=DeferredEvaluationResponse)
+async def evaluate_interview_batch(request: InterviewBatchEvaluationRequest):
+    """
+    Queue evaluations of many completed interviews as one Batch API job
+    For bulk, non-interactive work (reprocessing, dashboards); poll
+    /api/interview/evaluate-batch/{batch_id} for the results
+    """
+    if not 1 <= len(request.interviews) <= MAX_BATCH_INTERVIEWS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Between 1 and {MAX_BATCH_INTERVIEWS} interviews can be evaluated at once"
         )
-        
-        # Parse the JSON response
-        evaluation_data = json.loads(response.choices[0].message.content)
-        
-        logger.info(f"✅ Evaluation completed")
-        logger.info(f"Overall Score: {evaluation_data.get('overall_score', 'N/A')}/10")
-        logger.info("-"*80)
-        
-        return InterviewEvaluationResponse(**evaluation_data)
-        
-    except json.JSONDecodeError as e:
-        logger.error(f"❌ Error parsing evaluation JSON: {str(e)}")
-        # Fallback response if JSON parsing fails
-        return InterviewEvaluationResponse(
-            overall_score=7.0,
-            category_scores={cat: 7.0 for cat in INTERVIEW_CATEGORIES},
-            strengths=["Completed the interview", "Engaged with questions", "Professional demeanor"],
-            areas_for_improvement=["Provide more specific examples", "Elaborate on technical knowledge", "Strengthen communication skills"],
-            detailed_feedback="Thank you for completing the interview practice session. Your responses showed engagement with the questions. To improve, focus on providing more detailed examples from your experience and demonstrating deeper technical knowledge.",
-            summary="Good effort in the practice interview with room for growth in several areas."
+    
+    try:
+        logger.info("\n📊 QUEUEING %d INTERVIEW EVALUATIONS", len(request.interviews))
+        batch = await submit_evaluation_batch(
+            [build_interview_evaluation_messages(interview) for interview in request.interviews]
         )
+        logger.info("🕒 Evaluations queued as %s", batch["id"])
+        return DeferredEvaluationResponse(batch_id=batch["id"], status=batch["status"])
     except Exception as e:
-        logger.error(f"❌ Error evaluating interview: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Error evaluating interview: {str(e)}")
+        logger.error(f"❌ Error queueing interview evaluations: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error queueing evaluations: {str(e)}")
+
+@app.get("/api/interview/evaluate-batch/{batch_id}", response_model=Union[InterviewBatchEvaluationResponse, DeferredEvaluationResponse])
+async def get_interview_batch_evaluations(batch_id: str):
+    """
+    Fetch evaluations queued with /api/interview/evaluate-batch
+    Returns 202 with the batch status until every evaluation is ready
+    """
+    batch = await fetch_evaluation_batch(batch_id)
+    pending = pending_batch_response(batch_id, batch)
+    if pending is not None:
+        return pending
+    
+    try:
+        return InterviewBatchEvaluationResponse(evaluations=await read_evaluation_batch(batch))
+    except Exception as e:
+        logger.error(f"❌ Error reading evaluation batch output: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error reading evaluations: {str(e)}")
+
+# Both listings are fixed, so their JSON bodies are encoded once at import
+CATEGORIES_BODY = orjson.dumps({
+    "categories": INTERVIEW_CATEGORIES,
+    "total": len(INTERVIEW_CATEGORIES)
+})
+INTERVIEW_TYPES_BODY = orjson.dumps({
+    "types": ["dentist", "hygienist"],
+    "descriptions": {
+        "dentist": "Interview practice for dentist positions focusing on clinical expertise and practice management",
+        "hygienist": "Interview practice for dental hygienist positions focusing on preventive care and patient education"
+    }
+})
 
 @app.get("/api/categories")
 async def get_categories():
     """Get list of interview categories"""
-    return {
-        "categories": INTERVIEW_CATEGORIES,
-        "total": len(INTERVIEW_CATEGORIES)
-    }
+    return Response(content=CATEGORIES_BODY, media_type="application/json")
 
 @app.get("/api/interview-types")
 async def get_interview_types():
     """Get available interview types"""
-    return {
-        "types": ["dentist", "hygienist"],
-        "descriptions": {
-            "dentist": "Interview practice for dentist positions focusing on clinical expertise and practice management",
-            "hygienist": "Interview practice for dental hygienist positions focusing on preventive care and patient education"
-        }
-    }
+    return Response(content=INTERVIEW_TYPES_BODY, media_type="application/json")
 
 # ===== LOG VIEWER ENDPOINTS =====
 
+# The log viewer page is static, so read it once instead of on every request
+LOGS_HTML_PATH = os.path.join(os.path.dirname(__file__), "logs.html")
+LOGS_HTML = None
+LOGS_HTML_GZIP = None
+LOGS_HTML_ETAG = None
+if os.path.exists(LOGS_HTML_PATH):
+    with open(LOGS_HTML_PATH, 'rb') as f:
+        LOGS_HTML = f.read()
+    LOGS_HTML_GZIP = gzip.compress(LOGS_HTML, compresslevel=9, mtime=0)
+    LOGS_HTML_ETAG = f'"{hashlib.sha1(LOGS_HTML).hexdigest()}"'
+
+# Seconds of silence before the live log stream sends a heartbeat
+LOG_SSE_HEARTBEAT_SECONDS = 15
+
 @app.get("/logs", response_class=HTMLResponse)
-async def serve_logs_page():
+async def serve_logs_page(request: Request):
     """Serve the log viewer HTML page"""
-    import os
-    logs_html_path = os.path.join(os.path.dirname(__file__), "logs.html")
-    
-    if os.path.exists(logs_html_path):
-        with open(logs_html_path, 'r', encoding='utf-8') as f:  # ← This fixes it!
-            return HTMLResponse(content=f.read())
+    if LOGS_HTML is not None:
+        return preloaded_html_response(request, LOGS_HTML, LOGS_HTML_GZIP, LOGS_HTML_ETAG)
     else:
         return HTMLResponse(
             content="<h1>Log viewer not found</h1><p>Please ensure logs.html exists</p>",
@@ -1158,7 +2476,9 @@ async def serve_logs_page():
 async def get_logs(
     limit: Optional[int] = Query(100, ge=1, le=1000),
     level: Optional[str] = Query(None),
-    since: Optional[str] = Query(None)
+    since: Optional[str] = Query(None),
+    since_epoch: Optional[float] = Query(None),
+    after_seq: Optional[int] = Query(None, ge=0)
 ):
     """Get application logs with optional filtering"""
     try:
@@ -1166,12 +2486,14 @@ async def get_logs(
         if since:
             since_dt = datetime.fromisoformat(since)
         
-        logs = log_capture.get_logs(limit=limit, level=level, since=since_dt)
+        logs = log_capture.get_logs(limit=limit, level=level, since=since_dt,
+                                    since_epoch=since_epoch, after_seq=after_seq)
         
         return {
             "success": True,
             "count": len(logs),
-            "logs": logs
+            "logs": logs,
+            "cursor": logs[-1]['seq'] if logs else (after_seq or 0)
         }
     except Exception as e:
         logger.error(f"Error fetching logs: {str(e)}")
@@ -1182,14 +2504,25 @@ async def get_logs(
         }
 
 @app.get("/api/logs/stats")
-async def get_log_stats():
+async def get_log_stats(request: Request):
     """Get statistics about application logs"""
     try:
         stats = log_capture.get_stats()
-        return {
-            "success": True,
-            "stats": stats
-        }
+        
+        # Stats only change when a log is captured or cleared, so the
+        # total plus newest timestamp identifies this exact body
+        etag = f'W/"{stats["total"]}-{stats["newest"]}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers=headers)
+        
+        return ORJSONResponse(
+            content={
+                "success": True,
+                "stats": stats
+            },
+            headers=headers
+        )
     except Exception as e:
         logger.error(f"Error fetching log stats: {str(e)}")
         return {
@@ -1197,6 +2530,34 @@ async def get_log_stats():
             "error": str(e)
         }
 
+@app.get("/api/logs/sse")
+async def stream_logs_sse():
+    """
+    Push each new log entry to the client as a Server-Sent Event
+    
+    Replaces polling /api/logs/stream with one long-lived connection.
+    A comment line is sent as a heartbeat when no logs arrive for a while.
+    """
+    queue = log_capture.subscribe()
+    
+    async def event_stream():
+        try:
+            while True:
+                try:
+                    entry = await asyncio.wait_for(queue.get(), timeout=LOG_SSE_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": heartbeat\n\n"
+                    continue
+                yield b"data: " + orjson.dumps(entry) + b"\n\n"
+        finally:
+            log_capture.unsubscribe(queue)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
 @app.delete("/api/logs")
 async def clear_logs():
     """Clear all captured logs"""
@@ -1216,4 +2577,15 @@ async def clear_logs():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # Background turn scores, the evaluation cache and the captured logs live
+    # in process memory, so extra workers are opt-in (WEB_CONCURRENCY)
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    uvicorn.run(
+        # Worker processes import the app themselves, so they need its import string
+        app if workers == 1 else "main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=workers,
+        loop="uvloop",
+        http="httptools"
+    )
\ No newline at end of file
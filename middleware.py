@@ -0,0 +1,154 @@
+"""
+Middleware for the Dental Interview Practice API
+Response compression that leaves streamed and already-compressed content alone,
+CORS with precomputed headers, and early rejection of oversized uploads
+"""
+
+from typing import Sequence
+
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse, PlainTextResponse, Response
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder
+from starlette.types import Message, Receive, Scope, Send
+
+# Content types that are sent as-is. Gzip buffers small writes, which would
+# hold Server-Sent Events back indefinitely, and audio, video, raster images,
+# web fonts and archives are already compressed, so gzipping them only costs CPU.
+UNCOMPRESSED_CONTENT_TYPES = (
+    "text/event-stream",
+    "audio/",
+    "video/",
+    "image/png",
+    "image/jpeg",
+    "image/gif",
+    "image/webp",
+    "font/woff",
+    "application/zip",
+    "application/gzip",
+)
+
+
+class SelectiveGZipResponder(GZipResponder):
+    """GZipResponder that passes excluded content types through untouched"""
+
+    async def send_with_gzip(self, message: Message) -> None:
+        await super().send_with_gzip(message)
+        if message["type"] == "http.response.start":
+            content_type = Headers(raw=message["headers"]).get("content-type", "")
+            if content_type.startswith(UNCOMPRESSED_CONTENT_TYPES):
+                # Reuse the responder's "already encoded" path to send as-is
+                self.content_encoding_set = True
+
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """Gzip responses for clients that accept it, except UNCOMPRESSED_CONTENT_TYPES"""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            headers = Headers(scope=scope)
+            if "gzip" in headers.get("Accept-Encoding", ""):
+                responder = SelectiveGZipResponder(
+                    self.app, self.minimum_size, compresslevel=self.compresslevel
+                )
+                await responder(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Answer 413 for requests to the given paths whose declared Content-Length
+    exceeds max_bytes, before any of the body is read or parsed
+    """
+
+    def __init__(self, app, max_bytes: int, paths: Sequence[str]):
+        self.app = app
+        self.max_bytes = max_bytes
+        self.paths = tuple(paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in self.paths:
+            content_length = Headers(scope=scope).get("content-length", "")
+            if content_length.isdigit() and int(content_length) > self.max_bytes:
+                response = JSONResponse(
+                    {"detail": f"Upload too large (limit {self.max_bytes // (1024 * 1024)} MB)"},
+                    status_code=413
+                )
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+# Request headers browsers may always send cross-origin
+SAFELISTED_HEADERS = ("Accept", "Accept-Language", "Content-Language", "Content-Type")
+
+
+class CORSMiddleware:
+    """
+    Pure ASGI CORS with every header value built once at startup
+    Requests without an Origin pass straight through. Preflights are answered
+    with 204 without reaching the app; other responses to allowed origins get
+    the fixed headers appended as they start. With explicit origins the origin
+    is echoed back and credentials are allowed; with "*" they are not.
+    """
+
+    def __init__(self, app, allow_origins: Sequence[str], allow_methods: Sequence[str],
+                 allow_headers: Sequence[str], max_age: int = 600):
+        self.app = app
+        self.allow_all = "*" in allow_origins
+        self.allow_origins = frozenset(origin.encode("latin-1") for origin in allow_origins)
+        self.allow_methods = frozenset(method.encode("latin-1") for method in allow_methods)
+
+        header_names = sorted(set(SAFELISTED_HEADERS) | set(allow_headers))
+        preflight = [
+            (b"access-control-allow-methods", ", ".join(allow_methods).encode("latin-1")),
+            (b"access-control-allow-headers", ", ".join(header_names).encode("latin-1")),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+        ]
+        if self.allow_all:
+            self.simple_headers = [(b"access-control-allow-origin", b"*")]
+        else:
+            self.simple_headers = [(b"access-control-allow-credentials", b"true"), (b"vary", b"Origin")]
+        self.preflight_headers = preflight + self.simple_headers
+
+    def origin_headers(self, origin: bytes):
+        """Headers naming the allowed origin (empty with "*", which is fixed)"""
+        return [] if self.allow_all else [(b"access-control-allow-origin", origin)]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = request_method = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        allowed = self.allow_all or origin in self.allow_origins
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            if allowed and request_method in self.allow_methods:
+                response = Response(status_code=204)
+                response.raw_headers.extend(self.preflight_headers + self.origin_headers(origin))
+            else:
+                response = PlainTextResponse("Disallowed CORS request", status_code=400)
+            await response(scope, receive, send)
+            return
+
+        if not allowed:
+            await self.app(scope, receive, send)
+            return
+
+        extra_headers = self.simple_headers + self.origin_headers(origin)
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", ())) + extra_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
@@ -3,7 +3,8 @@ Scoring Rubrics for Dental Interview Practice
 Turn-by-Turn Evaluation System with Structured Rubrics
 """
 
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from pydantic import BaseModel
 import json
 
@@ -473,6 +474,19 @@ def calculate_weighted_score(criterion_scores: Dict[str, float], criteria: List[
     weighted_sum = sum(criterion_scores.get(c.name, 0) * c.weight for c in criteria)
     return round(weighted_sum / total_weight, 1) if total_weight > 0 else 0.0
 
+@lru_cache(maxsize=None)
+def get_rubric_weights(category: str) -> Tuple[Tuple[str, float], ...]:
+    """Criterion names with weights normalized to sum to 1, computed once per category"""
+    criteria = get_rubric_for_category(category).criteria
+    total_weight = sum(c.weight for c in criteria)
+    if total_weight <= 0:
+        return ()
+    return tuple((c.name, c.weight / total_weight) for c in criteria)
+
+def calculate_category_score(criterion_scores: Dict[str, float], category: str) -> float:
+    """Weighted average score for a category, using its precomputed weights"""
+    return round(sum(criterion_scores.get(name, 0) * weight for name, weight in get_rubric_weights(category)), 1)
+
 def format_rubric_for_prompt(rubric: CategoryRubric) -> str:
     """Format rubric into a string for LLM prompt"""
     lines = [f"CATEGORY: {rubric.category}", ""]
@@ -488,4 +502,13 @@ def format_rubric_for_prompt(rubric: CategoryRubric) -> str:
             lines.append(f"   • {score_range}: {description}")
         lines.append("")
     
-    return "\n".join(lines)
\ No newline at end of file
+    return "\n".join(lines)
+
+@lru_cache(maxsize=None)
+def get_rubric_prompt_for_category(category: str) -> str:
+    """
+    Rubric prompt text for a category, built once and reused
+    Returns the same string object every time, so prompts that embed it
+    stay byte-identical across requests
+    """
+    return format_rubric_for_prompt(get_rubric_for_category(category))
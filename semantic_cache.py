@@ -0,0 +1,123 @@
+"""
+Semantic Cache
+Reuses results (follow-up questions, answer analyses) computed for
+near-identical candidate answers
+"""
+
+import random
+import time
+from array import array
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional, Sequence
+
+
+def dot(a: Sequence[float], b: Sequence[float]) -> float:
+    """Dot product; equal to cosine similarity for unit-length embeddings"""
+    return sum(x * y for x, y in zip(a, b))
+
+
+class _CachedAnswer:
+    """An answer embedding and the values computed for it"""
+
+    __slots__ = ("embedding", "values", "expires_at")
+
+    def __init__(self, embedding: array, expires_at: float):
+        self.embedding = embedding
+        self.values: List[Any] = []
+        self.expires_at = expires_at
+
+
+class SemanticCache:
+    """
+    Maps (context key, answer embedding) to previously computed values
+
+    Embeddings are bucketed by random-hyperplane LSH so a lookup only compares
+    against answers in the same bucket. A cached value is served only once
+    `min_variants` different values exist for a similar answer, and then one
+    is picked at random, so e.g. repeat answers still get varied questions.
+    Buckets are kept in LRU order; the least recently used are dropped once
+    more than `max_entries` answers are cached, and empty ones straight away.
+    """
+
+    def __init__(self, dimensions: int = 1536, planes: int = 8, threshold: float = 0.92,
+                 min_variants: int = 3, ttl_seconds: float = 24 * 3600,
+                 max_per_bucket: int = 32, max_entries: int = 2048,
+                 max_embeddings: int = 256, seed: int = 7):
+        rng = random.Random(seed)
+        self.planes = [array('f', (rng.gauss(0, 1) for _ in range(dimensions))) for _ in range(planes)]
+        self.threshold = threshold
+        self.min_variants = min_variants
+        self.ttl_seconds = ttl_seconds
+        self.max_per_bucket = max_per_bucket
+        self.max_entries = max_entries
+        self.entries = 0
+        self.buckets: "OrderedDict[Hashable, List[_CachedAnswer]]" = OrderedDict()
+        # Recently embedded texts, so retries don't pay for the embedding again
+        self.max_embeddings = max_embeddings
+        self.embeddings: "OrderedDict[str, array]" = OrderedDict()
+
+    def remember_embedding(self, text: str, embedding: Sequence[float]) -> array:
+        """Store an embedding (as float32) for text and return it"""
+        packed = array('f', embedding)
+        self.embeddings[text] = packed
+        self.embeddings.move_to_end(text)
+        if len(self.embeddings) > self.max_embeddings:
+            self.embeddings.popitem(last=False)
+        return packed
+
+    def known_embedding(self, text: str) -> Optional[array]:
+        """Embedding previously remembered for text, if any"""
+        embedding = self.embeddings.get(text)
+        if embedding is not None:
+            self.embeddings.move_to_end(text)
+        return embedding
+
+    def _bucket(self, key: Hashable, embedding: Sequence[float], create: bool = False) -> List[_CachedAnswer]:
+        """Unexpired entries for key near embedding; kept in the cache only if non-empty or create"""
+        signature = 0
+        for plane in self.planes:
+            signature = (signature << 1) | (dot(plane, embedding) >= 0)
+        bucket_key = (key, signature)
+        now = time.monotonic()
+        cached = self.buckets.pop(bucket_key, ())
+        bucket = [entry for entry in cached if entry.expires_at > now]
+        self.entries -= len(cached) - len(bucket)
+        if bucket or create:
+            self.buckets[bucket_key] = bucket
+        return bucket
+
+    def _evict(self):
+        """Drop least recently used buckets until at most max_entries answers remain"""
+        while self.entries > self.max_entries and len(self.buckets) > 1:
+            _, bucket = self.buckets.popitem(last=False)
+            self.entries -= len(bucket)
+
+    def _closest(self, bucket: List[_CachedAnswer], embedding: Sequence[float]) -> Optional[_CachedAnswer]:
+        best, best_score = None, self.threshold
+        for entry in bucket:
+            score = dot(entry.embedding, embedding)
+            if score >= best_score:
+                best, best_score = entry, score
+        return best
+
+    def lookup(self, key: Hashable, embedding: Sequence[float]) -> Optional[Any]:
+        """A cached value for a similar answer under key, or None"""
+        entry = self._closest(self._bucket(key, embedding), embedding)
+        if entry is None or len(entry.values) < self.min_variants:
+            return None
+        return random.choice(entry.values)
+
+    def store(self, key: Hashable, embedding: Sequence[float], value: Any):
+        """Record a value computed for an answer with this embedding"""
+        bucket = self._bucket(key, embedding, create=True)
+        entry = self._closest(bucket, embedding)
+        if entry is None:
+            if len(bucket) >= self.max_per_bucket:
+                bucket.pop(0)
+                self.entries -= 1
+            entry = _CachedAnswer(array('f', embedding), time.monotonic() + self.ttl_seconds)
+            bucket.append(entry)
+            self.entries += 1
+            self._evict()
+        if value not in entry.values and len(entry.values) < self.min_variants:
+            entry.values.append(value)
@@ -0,0 +1,138 @@
+"""
+Static File Serving for the Dental Interview Practice frontend
+Serves the (small) frontend from memory, with content-hash ETags and
+long-lived caching for fingerprinted asset URLs
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+from typing import Dict, NamedTuple, Optional
+
+from starlette.datastructures import Headers, QueryParams
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+# Browsers may keep a fingerprinted asset for a year without revalidating;
+# a changed file gets a new fingerprint, and so a new URL
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+# Files up to this size are kept in memory; larger ones are read from disk
+MAX_PRELOAD_BYTES = 512 * 1024
+
+# Already-compressed formats gain nothing from gzip
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml")
+
+# "/static/<file>" references inside HTML attributes
+STATIC_URL_PATTERN = re.compile(rb'(["\'])/static/([^"\'?#]+)\1')
+
+
+class StaticEntry(NamedTuple):
+    """A preloaded static file"""
+    content: bytes
+    gzipped: Optional[bytes]
+    media_type: str
+    etag: str
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles that reads and hashes every file once at startup
+    Small files (and a gzip copy of text ones) are served from memory with no
+    filesystem access. Requests carrying the file's current fingerprint
+    (?v=...) are cacheable forever; anything else must revalidate, which is
+    a cheap 304
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.etags: Dict[str, str] = {}
+        self.files: Dict[str, StaticEntry] = {}
+        for root, dirs, files in os.walk(self.directory):
+            # Skip .git, __pycache__ and friends when serving a source folder
+            dirs[:] = [d for d in dirs if not d.startswith((".", "__"))]
+            for name in files:
+                self._load(os.path.join(root, name))
+
+    def _load(self, full_path: str):
+        with open(full_path, "rb") as f:
+            content = f.read()
+        etag = f'"{hashlib.sha1(content).hexdigest()}"'
+        self.etags[os.path.realpath(full_path)] = etag
+        if len(content) > MAX_PRELOAD_BYTES:
+            return
+
+        media_type = mimetypes.guess_type(full_path)[0] or "text/plain"
+        gzipped = None
+        if media_type.startswith(COMPRESSIBLE_TYPES):
+            gzipped = gzip.compress(content, compresslevel=9, mtime=0)
+            if len(gzipped) >= len(content):
+                gzipped = None
+        relative_path = os.path.normpath(os.path.relpath(full_path, self.directory))
+        self.files[relative_path] = StaticEntry(content, gzipped, media_type, etag)
+
+    def fingerprint(self, path: str) -> str:
+        """Short content hash for a path relative to the static directory"""
+        etag = self.etags.get(os.path.realpath(os.path.join(self.directory, path)))
+        return etag.strip('"')[:12] if etag else ""
+
+    def versioned_urls(self, html: bytes) -> bytes:
+        """Append ?v=<fingerprint> to every /static/ URL in an HTML page"""
+        def add_version(match: re.Match) -> bytes:
+            quote, path = match.group(1), match.group(2)
+            version = self.fingerprint(path.decode())
+            if not version:
+                return match.group(0)
+            return quote + b"/static/" + path + b"?v=" + version.encode() + quote
+        return STATIC_URL_PATTERN.sub(add_version, html)
+
+    def cache_headers(self, etag: str, scope: Scope) -> Dict[str, str]:
+        """ETag and Cache-Control for a file, based on the requested fingerprint"""
+        version = QueryParams(scope.get("query_string", b"")).get("v")
+        if version and etag.strip('"').startswith(version):
+            cache_control = IMMUTABLE_CACHE_CONTROL
+        else:
+            cache_control = REVALIDATE_CACHE_CONTROL
+        return {"etag": etag, "cache-control": cache_control}
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        entry = self.files.get(path)
+        if entry is None or scope["method"] not in ("GET", "HEAD"):
+            return await super().get_response(path, scope)
+
+        request_headers = Headers(scope=scope)
+        headers = self.cache_headers(entry.etag, scope)
+        if self.is_not_modified(Headers(headers), request_headers):
+            return NotModifiedResponse(Headers(headers))
+
+        content = entry.content
+        if entry.gzipped is not None:
+            headers["vary"] = "Accept-Encoding"
+            if "gzip" in request_headers.get("accept-encoding", ""):
+                content = entry.gzipped
+                headers["content-encoding"] = "gzip"
+        return Response(content, media_type=entry.media_type, headers=headers)
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+
+        response = FileResponse(full_path, status_code=status_code, stat_result=stat_result)
+        # lookup_path has already resolved full_path, so try it as-is before
+        # paying for another realpath() walk (one lstat per path component)
+        etag = self.etags.get(full_path) or self.etags.get(os.path.realpath(full_path))
+        if etag is not None:
+            response.headers.update(self.cache_headers(etag, scope))
+
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
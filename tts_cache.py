@@ -0,0 +1,139 @@
+"""
+TTS Audio Cache
+Keeps generated speech so repeated text isn't re-synthesized by ElevenLabs
+"""
+
+import asyncio
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+
+def tts_cache_key(voice_id: str, model_id: str, voice_settings: str, text: str) -> str:
+    """Hash everything that affects the generated audio"""
+    return hashlib.sha256(f"{voice_id}|{model_id}|{voice_settings}|{text}".encode()).hexdigest()
+
+
+class TTSCache:
+    """
+    Two-tier audio cache: an in-memory LRU in front of one file per clip on disk.
+    The disk tier survives restarts and is shared by workers on the same host.
+    Once it holds more than max_disk_bytes, the least recently used clips
+    (oldest mtime; reads refresh it) are deleted down to 90% of the limit.
+    """
+
+    def __init__(self, max_items: int = 512, cache_dir: Optional[str] = None,
+                 max_disk_bytes: int = 512 * 1024 * 1024):
+        self.max_items = max_items
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.disk_bytes = 0
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            self.disk_bytes = sum(size for _, _, size in self._disk_entries())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.mp3")
+
+    def _remember(self, key: str, audio: bytes):
+        with self.lock:
+            self.memory[key] = audio
+            self.memory.move_to_end(key)
+            if len(self.memory) > self.max_items:
+                self.memory.popitem(last=False)
+
+    def _get_memory(self, key: str) -> Optional[bytes]:
+        with self.lock:
+            audio = self.memory.get(key)
+            if audio is not None:
+                self.memory.move_to_end(key)
+            return audio
+
+    def _disk_entries(self) -> List[Tuple[float, str, int]]:
+        """(mtime, path, size) of every cached clip on disk"""
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".mp3"):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, entry.path, stat.st_size))
+        return entries
+
+    def _evict_disk(self):
+        """Delete least recently used clips until the disk tier is back under its limit"""
+        entries = sorted(self._disk_entries())
+        # Recount from disk, since other workers write to the same directory
+        total = sum(size for _, _, size in entries)
+        target = self.max_disk_bytes * 0.9
+        for _, path, size in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+        self.disk_bytes = total
+
+    def _get_disk(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                audio = f.read()
+            os.utime(path)  # Mark as recently used for eviction
+        except OSError:
+            return None
+        self._remember(key, audio)
+        return audio
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached audio bytes, or None on a miss"""
+        audio = self._get_memory(key)
+        if audio is not None or not self.cache_dir:
+            return audio
+        return self._get_disk(key)
+
+    def put(self, key: str, audio: bytes):
+        """Store audio bytes in memory and on disk"""
+        self._remember(key, audio)
+        if self.cache_dir:
+            self._write(key, audio)
+
+    async def aget(self, key: str) -> Optional[bytes]:
+        """get() for async code: memory hits return at once, disk reads run in a thread"""
+        audio = self._get_memory(key)
+        if audio is not None or not self.cache_dir:
+            return audio
+        return await asyncio.to_thread(self._get_disk, key)
+
+    async def aput(self, key: str, audio: bytes):
+        """put() for async code: the disk write runs in a thread"""
+        self._remember(key, audio)
+        if self.cache_dir:
+            await asyncio.to_thread(self._write, key, audio)
+
+    def _write(self, key: str, audio: bytes):
+        # Write then rename so readers never see a partial file
+        tmp_path = f"{self._path(key)}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(audio)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        with self.lock:
+            self.disk_bytes += len(audio)
+            over_limit = self.disk_bytes > self.max_disk_bytes
+        if over_limit:
+            self._evict_disk()